@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 import argparse
+import dataclasses
+import importlib.util
 import logging
+import os
 import sys
 from typing import Optional
 
@@ -11,6 +14,13 @@ from .config import load_config
 from .app import create_app
 
 
+def _pick(preferred: str, module: str) -> str:
+    # uvloop/httptools come with uvicorn[standard] but not on every platform; let uvicorn choose otherwise
+    if preferred == module and importlib.util.find_spec(module) is None:
+        return "auto"
+    return preferred
+
+
 def main(argv: Optional[list[str]] = None) -> None:
     parser = argparse.ArgumentParser(description="Run the MarkItDown Web server")
     parser.add_argument("--host", default="127.0.0.1", help="Host to bind (default: 127.0.0.1)")
@@ -20,14 +30,50 @@ def main(argv: Optional[list[str]] = None) -> None:
         default=None,
         help="Path to markitdown_web.toml (default: ./markitdown_web.toml or MARKITDOWN_WEB_CONFIG)",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of worker processes (default: 1)",
+    )
+    parser.add_argument(
+        "--loop",
+        choices=["auto", "asyncio", "uvloop"],
+        default="uvloop",
+        help="Event loop implementation (default: uvloop, falling back to auto when not installed)",
+    )
+    parser.add_argument(
+        "--cache-size",
+        type=int,
+        default=None,
+        help="Number of converted documents to cache by content hash; 0 disables (default: from config, 128)",
+    )
     args = parser.parse_args(argv)
 
     cfg = load_config(args.config)
+    if args.cache_size is not None:
+        cfg = dataclasses.replace(cfg, cache_size=args.cache_size)
+        # Workers in multi-process mode rebuild their config from the environment
+        os.environ["MARKITDOWN_WEB_CACHE_SIZE"] = str(args.cache_size)
 
     logging.basicConfig(level=getattr(logging, cfg.log_level.upper(), logging.INFO))
 
-    app = create_app(cfg)
-    uvicorn.run(app, host=args.host, port=args.port, log_level=cfg.log_level)
+    run_opts = dict(
+        host=args.host,
+        port=args.port,
+        log_level=cfg.log_level,
+        loop=_pick(args.loop, "uvloop"),
+        http=_pick("httptools", "httptools"),
+        access_log=False,
+    )
+    if args.workers > 1:
+        # Multi-process mode needs an import string; workers rebuild the app from the same config
+        if args.config:
+            os.environ["MARKITDOWN_WEB_CONFIG"] = os.path.abspath(args.config)
+        uvicorn.run("markitdown_web.app:app_factory", factory=True, workers=args.workers, **run_opts)
+    else:
+        app = create_app(cfg)
+        uvicorn.run(app, **run_opts)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,110 @@
+"""Batched small-file writes over io_uring (Linux 5.6+, optional ``liburing`` package).
+
+Writing an extracted archive member costs an open, a write and a close. For archives of
+many small files those syscalls dominate, so here each phase is submitted for a whole batch
+of files at once and the kernel is entered three times per batch instead of three times
+per file.
+"""
+
+from __future__ import annotations
+
+import errno
+import itertools
+import os
+from typing import Callable, Iterable
+
+try:
+    from liburing import (  # type: ignore
+        Cqe,
+        Ring,
+        io_uring_cq_advance,
+        io_uring_cq_ready,
+        io_uring_get_sqe,
+        io_uring_prep_close,
+        io_uring_prep_open,
+        io_uring_prep_write,
+        io_uring_queue_exit,
+        io_uring_queue_init,
+        io_uring_submit_and_wait,
+        io_uring_wait_cqe,
+    )
+except Exception:  # pragma: no cover - optional speedup
+    Ring = None  # type: ignore
+
+# Submission queue depth; also the number of files handled per batch
+RING_DEPTH = 256
+
+_OPEN_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_CLOEXEC", 0)
+
+
+def available() -> bool:
+    return Ring is not None
+
+
+def _run_batch(ring, cqe, count: int, prep: Callable[[object, int], None]) -> list[int]:
+    """Queue ``count`` SQEs via ``prep(sqe, index)``, submit them, and return each result."""
+    for i in range(count):
+        sqe = io_uring_get_sqe(ring)
+        prep(sqe, i)
+        sqe.user_data = i
+    io_uring_submit_and_wait(ring, count)
+
+    results = [0] * count
+    seen = 0
+    while seen < count:
+        io_uring_wait_cqe(ring, cqe)
+        ready = io_uring_cq_ready(ring)
+        for i in range(ready):
+            entry = cqe[i]
+            index = entry.user_data
+            try:
+                results[index] = entry.res
+            except OSError as e:
+                # The binding raises for negative results; keep the kernel's -errno convention
+                results[index] = -(e.errno or errno.EIO)
+        io_uring_cq_advance(ring, ready)
+        seen += ready
+    return results
+
+
+def write_files(files: Iterable[tuple[str, bytes]]) -> None:
+    """Create (or truncate) each path and write its payload, in batches of ``RING_DEPTH``.
+
+    ``files`` is consumed one batch at a time, so a lazy iterable keeps at most
+    ``RING_DEPTH`` payloads in memory. Files get mode ``0o666`` less the umask, as ``open()``
+    would give them.
+
+    Raises ``OSError`` if the ring cannot be set up (old kernel, io_uring disabled) or if
+    any open or write fails; files opened by the failing batch are still closed.
+    """
+    ring = Ring()
+    cqe = Cqe()
+    io_uring_queue_init(RING_DEPTH, ring)
+    try:
+        it = iter(files)
+        while True:
+            batch = list(itertools.islice(it, RING_DEPTH))
+            if not batch:
+                break
+            paths = [path for path, _ in batch]
+            fds = _run_batch(ring, cqe, len(batch), lambda sqe, i: io_uring_prep_open(sqe, paths[i], _OPEN_FLAGS, 0o666))
+            opened = [i for i, fd in enumerate(fds) if fd >= 0]
+            error = next((OSError(-fd, os.strerror(-fd), batch[i][0]) for i, fd in enumerate(fds) if fd < 0), None)
+            try:
+                if error is None:
+                    written = _run_batch(
+                        ring, cqe, len(batch), lambda sqe, i: io_uring_prep_write(sqe, fds[i], batch[i][1], 0)
+                    )
+                    for i, n in enumerate(written):
+                        if n < 0:
+                            raise OSError(-n, os.strerror(-n), batch[i][0])
+                        # Regular files rarely write short, but finish the job if they do
+                        data = memoryview(batch[i][1])
+                        while n < len(data):
+                            n += os.pwrite(fds[i], data[n:], n)
+            finally:
+                _run_batch(ring, cqe, len(opened), lambda sqe, i: io_uring_prep_close(sqe, fds[opened[i]]))
+            if error is not None:
+                raise error
+    finally:
+        io_uring_queue_exit(ring)
@@ -1,75 +1,95 @@
 from __future__ import annotations
 
+import contextlib
+import functools
+import hashlib
+import io
+import multiprocessing
 import os
 import tempfile
-from typing import Optional
+import threading
+import types
+import zlib
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from enum import Enum
+from typing import AsyncIterator, BinaryIO, Callable, Optional
 import zipfile
 import shutil
 from pathlib import Path
 
+import anyio
 from fastapi import FastAPI, File, UploadFile, Query, Depends, HTTPException, Header, Request
-from fastapi.responses import PlainTextResponse, HTMLResponse, Response, JSONResponse
-from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import PlainTextResponse, Response, JSONResponse, StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
-from starlette.status import HTTP_400_BAD_REQUEST, HTTP_401_UNAUTHORIZED, HTTP_413_REQUEST_ENTITY_TOO_LARGE
+from starlette.status import (
+    HTTP_400_BAD_REQUEST,
+    HTTP_401_UNAUTHORIZED,
+    HTTP_503_SERVICE_UNAVAILABLE,
+)
 
-from .config import WebConfig
+from . import _uring
+from .cache import ConversionCache, content_hasher
+from .config import WebConfig, load_config
+from .middleware import HealthzMiddleware, MaxBodySizeMiddleware, SelectiveGZipMiddleware
 
+# ISA-L's SIMD deflate is wire-compatible with zlib and several times faster; use it when installed
 try:
-    from markitdown import MarkItDown  # type: ignore
-except Exception:  # pragma: no cover
-    MarkItDown = None  # type: ignore
+    from isal import isal_zlib as _zlib  # type: ignore
+except Exception:  # pragma: no cover - optional speedup
+    _zlib = zlib  # type: ignore
+    _ZIP_COMPRESSLEVEL = 6
+else:
+    _ZIP_COMPRESSLEVEL = _zlib.ISAL_DEFAULT_COMPRESSION
+    # Route zipfile's inflate (upload extraction) through ISA-L as well. Compression stays on
+    # stdlib zlib, whose 0-9 levels callers may pass; ISA-L only accepts 0-3.
+    zipfile.zlib = types.SimpleNamespace(**{**vars(zlib), "decompressobj": _zlib.decompressobj})  # type: ignore[attr-defined]
 
-# Bulk conversion support from core package (optional at import time for tests)
-try:  # pragma: no cover - exercised in dedicated tests
-    from markitdown.bulk_converter import (
-        bulk_convert,
-        BulkConvertThresholds,
-    )  # type: ignore
-except Exception:  # pragma: no cover
-    bulk_convert = None  # type: ignore
-    BulkConvertThresholds = None  # type: ignore
+# The markitdown core is imported on first use rather than at module load: importing it
+# pulls in magika and every converter's dependencies, which dominates worker boot time.
 
 
-def create_app(config: WebConfig) -> FastAPI:
-    app = FastAPI(title="MarkItDown Web", version="0.1.0")
+def _new_converter(enable_plugins: bool):
+    try:
+        from markitdown import MarkItDown  # type: ignore
+    except Exception as e:  # pragma: no cover
+        raise RuntimeError("markitdown package is not available") from e
+    return MarkItDown(enable_plugins=enable_plugins)
 
-    # GZip is how we provide the "compressed plaintext" behavior when requested by the client
-    app.add_middleware(GZipMiddleware, minimum_size=512)
 
-    if config.cors_origins:
-        app.add_middleware(
-            CORSMiddleware,
-            allow_origins=config.cors_origins,
-            allow_methods=["*"],
-            allow_headers=["*"],
-        )
+@functools.lru_cache(maxsize=None)
+def _bulk_runner():
+    """Return ``bulk_convert`` with the web defaults bound, or None if it is unavailable."""
+    try:
+        from markitdown.bulk_converter import BulkConvertThresholds, bulk_convert  # type: ignore
+    except Exception:  # pragma: no cover
+        return None
+    # Archive uploads past these limits need ?confirm=true
+    thresholds = BulkConvertThresholds(max_dirs=16, max_files=128, max_bytes=300 * 1024 * 1024)
+    return functools.partial(
+        bulk_convert,
+        on_conflict="rename",
+        continue_on_error=True,
+        thresholds=thresholds,
+        skip_hidden=True,
+    )
 
-    # Instantiate converter once at startup according to config
-    if MarkItDown is None:
-        raise RuntimeError("markitdown package is not available")
-    converter = MarkItDown(enable_plugins=config.enable_plugins)
 
-    async def require_api_key(x_api_key: Optional[str] = Header(default=None)) -> None:
-        if not x_api_key or x_api_key != config.api_key:
-            raise HTTPException(status_code=HTTP_401_UNAUTHORIZED, detail="invalid or missing API key")
+def _confirmed(stats, thresholds) -> bool:
+    return True
 
-    @app.exception_handler(HTTPException)
-    async def http_exception_handler(_: Request, exc: HTTPException):
-        return JSONResponse(status_code=exc.status_code, content={"error": {"code": exc.status_code, "message": exc.detail}})
 
-    @app.exception_handler(Exception)
-    async def generic_exception_handler(_: Request, exc: Exception):  # pragma: no cover
-        return JSONResponse(status_code=500, content={"error": {"code": 500, "message": str(exc)}})
+def _not_confirmed(stats, thresholds) -> bool:
+    return False
 
-    @app.get("/healthz")
-    async def healthz() -> dict:
-        return {"status": "ok"}
 
-    @app.get("/")
-    async def index() -> HTMLResponse:
-        # Minimal single-file UI with on-demand preview
-        html = """
+class ResponseMode(str, Enum):
+    download = "download"
+    compressed = "compressed"
+
+
+# Minimal single-file UI with on-demand preview; encoded and hashed once at import
+_INDEX_HTML = """
 <!doctype html>
 <html lang=\"en\">
   <head>
@@ -166,8 +186,359 @@ def create_app(config: WebConfig) -> FastAPI:
     </script>
   </body>
 </html>
-        """
-        return HTMLResponse(content=html)
+"""
+_INDEX_BYTES = _INDEX_HTML.encode("utf-8")
+_INDEX_ETAG = f'"{hashlib.sha1(_INDEX_BYTES).hexdigest()}"'
+
+_ZIP_CHUNK_SIZE = 64 * 1024
+_ZIP_QUEUE_DEPTH = 16
+
+# With use_io_uring, archive members up to this size are batched through the ring; larger
+# ones gain little from batching and are streamed to disk as usual
+_URING_MAX_MEMBER = 256 * 1024
+
+
+class ChunkedBuffer(io.RawIOBase):
+    """Write-only sink that hands zip output to the response as it is produced.
+
+    Small writes (zip headers, deflate blocks) are coalesced into ~64 KiB chunks and
+    handed to ``emit``, which blocks while the consumer is behind, so the archive builder
+    waits instead of buffering the whole archive when the client reads slowly.
+    """
+
+    def __init__(self, emit: Callable[[bytes], None]) -> None:
+        self._emit = emit
+        self._pending = bytearray()
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, b) -> int:  # type: ignore[override]
+        self._pending += b
+        if len(self._pending) >= _ZIP_CHUNK_SIZE:
+            self._emit(bytes(self._pending))
+            self._pending.clear()
+        return len(b)
+
+    def flush(self) -> None:
+        if self._pending:
+            self._emit(bytes(self._pending))
+            self._pending.clear()
+
+
+def _real_fd(f: BinaryIO) -> Optional[int]:
+    # A SpooledTemporaryFile only has a usable descriptor once it has rolled over to disk;
+    # asking an in-memory one for fileno() would force that rollover
+    if isinstance(f, tempfile.SpooledTemporaryFile):
+        if not f._rolled:  # type: ignore[attr-defined]
+            return None
+        f = f._file  # type: ignore[attr-defined]
+    try:
+        return f.fileno()
+    except (AttributeError, OSError):
+        return None
+
+
+def _copy_upload(src: BinaryIO, dst: BinaryIO) -> None:
+    """Copy an upload into ``dst``, in-kernel via sendfile when both ends are real files."""
+    in_fd = _real_fd(src)
+    if in_fd is not None and hasattr(os, "sendfile"):
+        dst.flush()
+        out_fd = dst.fileno()
+        offset = 0
+        try:
+            while True:
+                sent = os.sendfile(out_fd, in_fd, offset, 1 << 30)
+                if sent == 0:
+                    return
+                offset += sent
+        except OSError:
+            # Some platforms only sendfile() to sockets; fall back if nothing was copied yet
+            if offset:
+                raise
+    src.seek(0)
+    shutil.copyfileobj(src, dst, 1024 * 1024)
+
+
+def _hash_upload(src: BinaryIO, hasher) -> None:
+    """Feed an upload to ``hasher`` through one reused 1 MiB buffer."""
+    buf = bytearray(1024 * 1024)
+    view = memoryview(buf)
+    readinto = getattr(src, "readinto", None)
+    while True:
+        if readinto is not None:
+            n = readinto(view)
+            chunk = view[:n]
+        else:  # pragma: no cover - file objects without readinto
+            chunk = src.read(len(buf))
+            n = len(chunk)
+        if not n:
+            return
+        hasher.update(chunk)
+
+
+def _member_dest(zi: zipfile.ZipInfo, extract_root: Path) -> Path:
+    """Resolve where a member extracts to, refusing paths that escape ``extract_root`` (zip-slip)."""
+    dest = (extract_root / zi.filename).resolve()
+    if dest != extract_root and extract_root not in dest.parents:
+        raise ValueError(f"unsafe path in archive: {zi.filename}")
+    return dest
+
+
+def _safe_extract(zf: zipfile.ZipFile, zi: zipfile.ZipInfo, dest: Path) -> None:
+    """Extract one archive member to ``dest``, as resolved by ``_member_dest``."""
+    if zi.is_dir():
+        dest.mkdir(parents=True, exist_ok=True)
+        return
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    with zf.open(zi) as src, open(dest, "wb") as out:
+        shutil.copyfileobj(src, out, 1024 * 1024)
+
+
+def _extract_small_uring(zf: zipfile.ZipFile, members: dict[Path, zipfile.ZipInfo]) -> dict[Path, zipfile.ZipInfo]:
+    """Write small members through batched io_uring submissions; return the members left over.
+
+    ``members`` maps each destination to its entry. If io_uring is unusable at runtime (old
+    kernel, disabled by sysctl or seccomp) every member is handed back so the regular path
+    extracts the whole archive.
+    """
+    small: dict[Path, zipfile.ZipInfo] = {}
+    rest: dict[Path, zipfile.ZipInfo] = {}
+    for dest, zi in members.items():
+        if zi.is_dir() or zi.file_size > _URING_MAX_MEMBER:
+            rest[dest] = zi
+        else:
+            small[dest] = zi
+    if not small:
+        return members
+
+    for parent in {dest.parent for dest in small}:
+        parent.mkdir(parents=True, exist_ok=True)
+    try:
+        # Inflated lazily, one ring batch at a time, so memory stays bounded by the batch
+        _uring.write_files((str(dest), zf.read(zi)) for dest, zi in small.items())
+    except OSError:
+        return members
+    return rest
+
+
+def _extract_zip(zip_path: str, extract_dir: str, use_io_uring: bool = False) -> None:
+    # ZipFile serializes reads of the shared handle but inflate and the writes overlap
+    extract_root = Path(extract_dir).resolve()
+    with zipfile.ZipFile(zip_path, "r") as zf:
+        # Duplicate names would race on one file across threads; the last entry wins, as it
+        # would with sequential extraction. Unsafe paths are refused before anything is written.
+        members = {_member_dest(zi, extract_root): zi for zi in zf.infolist()}
+        if use_io_uring and _uring.available():
+            members = _extract_small_uring(zf, members)
+        with ThreadPoolExecutor() as pool:
+            list(pool.map(lambda item: _safe_extract(zf, item[1], item[0]), members.items()))
+
+
+def _deflate_file(path: Path, arcname: str) -> tuple[zipfile.ZipInfo, bytes]:
+    """Read and raw-deflate one file, returning a ready-to-write zip entry."""
+    zinfo = zipfile.ZipInfo.from_file(path, arcname)
+    with open(path, "rb") as f:
+        data = f.read()
+    compressor = _zlib.compressobj(_ZIP_COMPRESSLEVEL, _zlib.DEFLATED, -_zlib.MAX_WBITS)
+    payload = compressor.compress(data) + compressor.flush()
+    zinfo.compress_type = zipfile.ZIP_DEFLATED
+    zinfo.file_size = len(data)
+    zinfo.compress_size = len(payload)
+    zinfo.CRC = _zlib.crc32(data)
+    return zinfo, payload
+
+
+def _write_precompressed(zf: zipfile.ZipFile, zinfo: zipfile.ZipInfo, payload: bytes) -> None:
+    """Append an entry whose deflate stream was produced elsewhere.
+
+    zipfile has no public API for this; this mirrors what ``ZipFile.open(mode="w")``
+    does, minus the compression. Sizes and CRC are known up front, so no data
+    descriptor is needed even when the target is not seekable.
+    """
+    with zf._lock:  # type: ignore[attr-defined]
+        if zf._seekable:  # type: ignore[attr-defined]
+            zf.fp.seek(zf.start_dir)  # type: ignore[union-attr]
+        zinfo.header_offset = zf.fp.tell()  # type: ignore[union-attr]
+        zf._writecheck(zinfo)  # type: ignore[attr-defined]
+        zf._didModify = True  # type: ignore[attr-defined]
+        zf.fp.write(zinfo.FileHeader())  # type: ignore[union-attr]
+        zf.fp.write(payload)  # type: ignore[union-attr]
+        zf.filelist.append(zinfo)
+        zf.NameToInfo[zinfo.filename] = zinfo
+        zf.start_dir = zf.fp.tell()  # type: ignore[union-attr]
+
+
+def _write_zip_dir(src_dir: str, buf: ChunkedBuffer) -> None:
+    # Flat file list first, largest first so the pool doesn't finish on one big straggler
+    src_root = Path(src_dir)
+    entries = [
+        (Path(r) / fn, (Path(r) / fn).relative_to(src_root).as_posix(), os.path.getsize(os.path.join(r, fn)))
+        for r, _, fs in os.walk(src_dir)
+        for fn in fs
+    ]
+    entries.sort(key=lambda e: e[2], reverse=True)
+
+    # zlib and ISA-L release the GIL, so deflating on threads scales with cores. Only a bounded
+    # window of compressed entries is held while the writer waits on the client.
+    workers = os.cpu_count() or 1
+    with ThreadPoolExecutor(max_workers=workers) as pool, zipfile.ZipFile(buf, "w") as outzip:
+        pending: deque[Future[tuple[zipfile.ZipInfo, bytes]]] = deque()
+        for full, arcname, _ in entries:
+            pending.append(pool.submit(_deflate_file, full, arcname))
+            if len(pending) >= 2 * workers:
+                _write_precompressed(outzip, *pending.popleft().result())
+        while pending:
+            _write_precompressed(outzip, *pending.popleft().result())
+    buf.flush()
+
+
+async def _iter_zip_dir(src_dir: str, cleanup: Optional[str] = None) -> AsyncIterator[bytes]:
+    """Zip ``src_dir`` on a dedicated thread, yielding archive bytes as soon as they exist.
+
+    Chunks cross over through a bounded memory stream that the producer feeds via
+    ``anyio.from_thread``, so a slow download never holds one of the shared worker threads
+    that uploads and conversions rely on. The producer also removes ``cleanup`` when done.
+    """
+    send, receive = anyio.create_memory_object_stream[object](_ZIP_QUEUE_DEPTH)
+    token = anyio.lowlevel.current_token()
+    done = object()
+
+    def _emit(item: object) -> None:
+        # Blocks while the stream is full; raises once the consumer has closed it
+        anyio.from_thread.run(send.send, item, token=token)
+
+    def _produce() -> None:
+        try:
+            try:
+                _write_zip_dir(src_dir, ChunkedBuffer(_emit))
+                item: object = done
+            except Exception as e:  # handed over to the consumer
+                item = e
+            finally:
+                # Before the final item, so cleanup is over by the time the response ends
+                if cleanup is not None:
+                    shutil.rmtree(cleanup, ignore_errors=True)
+            _emit(item)
+        except Exception:
+            # The consumer went away (or the event loop with it); there is no one left to tell
+            pass
+
+    threading.Thread(target=_produce, name="markitdown-web-zip", daemon=True).start()
+    try:
+        async with receive:
+            while True:
+                item = await receive.receive()
+                if item is done:
+                    break
+                if isinstance(item, BaseException):
+                    raise item
+                yield item  # type: ignore[misc]
+    finally:
+        # Closing both ends makes a producer blocked on a full stream give up
+        send.close()
+
+
+def create_app(config: WebConfig) -> FastAPI:
+    @contextlib.asynccontextmanager
+    async def lifespan(app: FastAPI):
+        try:
+            # Start building the converter in the background; requests await it if it isn't ready
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(_warm_converter)
+                yield
+                tg.cancel_scope.cancel()
+        finally:
+            app.state.bulk_pool.shutdown(wait=False, cancel_futures=True)
+
+    app = FastAPI(title="MarkItDown Web", version="0.1.0", lifespan=lifespan)
+
+    # Conversions are blocking (PDF/OCR/HTML parsing), so they run on at most convert_workers
+    # threads off the event loop, via anyio so either backend (asyncio or trio) can serve.
+    # Past max_concurrent_conversions we shed load instead of queueing.
+    convert_limiter = anyio.CapacityLimiter(config.convert_workers)
+    conversion_slots = anyio.Semaphore(config.max_concurrent_conversions)
+
+    # Archive members are converted on a process pool shared by all requests, so worker
+    # startup and MarkItDown construction are paid once rather than per upload. Workers are
+    # spawned lazily, and "spawn" avoids forking a process that is already running threads.
+    app.state.bulk_pool = ProcessPoolExecutor(
+        max_workers=os.cpu_count(), mp_context=multiprocessing.get_context("spawn")
+    )
+
+    async def _offload(fn, *args, **kwargs):
+        return await anyio.to_thread.run_sync(functools.partial(fn, *args, **kwargs), limiter=convert_limiter)
+
+    # GZip is how we provide the "compressed plaintext" behavior when requested by the client.
+    # Level 1 keeps most of the savings on markdown at a fraction of level 9's CPU cost.
+    app.add_middleware(SelectiveGZipMiddleware, minimum_size=512, compresslevel=1)
+
+    # Oversized uploads are refused before the app or compression touch them
+    app.add_middleware(MaxBodySizeMiddleware, limit=config.max_upload_bytes)
+
+    # Added after the size check so it wraps it: an early 413 still carries the CORS
+    # headers a cross-origin browser needs to read it
+    if config.cors_origins:
+        app.add_middleware(
+            CORSMiddleware,
+            allow_origins=config.cors_origins,
+            allow_methods=["*"],
+            allow_headers=["*"],
+        )
+
+    # Health probes are answered ahead of everything else, including the size check
+    app.add_middleware(HealthzMiddleware, path="/healthz")
+
+    # One converter per app, built off the event loop so the worker accepts connections
+    # while markitdown is still importing
+    converter = None
+    converter_error: Optional[Exception] = None
+    converter_building: Optional[anyio.Event] = None
+
+    async def _converter():
+        # The first caller builds it; later callers wait on that build instead of starting
+        # another. A cancelled build is retried by whoever asks next.
+        nonlocal converter, converter_error, converter_building
+        while converter is None:
+            if converter_error is not None:
+                raise converter_error
+            if converter_building is not None:
+                await converter_building.wait()
+                continue
+            building = converter_building = anyio.Event()
+            try:
+                converter = await _offload(_new_converter, config.enable_plugins)
+            except Exception as e:
+                converter_error = e
+            finally:
+                converter_building = None
+                building.set()
+        return converter
+
+    async def _warm_converter() -> None:
+        # A failed build is kept for the requests that need it (they answer 503); raising
+        # here would only tear down the lifespan after startup has been reported
+        with contextlib.suppress(Exception):
+            await _converter()
+
+    async def require_api_key(x_api_key: Optional[str] = Header(default=None)) -> None:
+        if not x_api_key or x_api_key != config.api_key:
+            raise HTTPException(status_code=HTTP_401_UNAUTHORIZED, detail="invalid or missing API key")
+
+    @app.exception_handler(HTTPException)
+    async def http_exception_handler(_: Request, exc: HTTPException):
+        return JSONResponse(status_code=exc.status_code, content={"error": {"code": exc.status_code, "message": exc.detail}})
+
+    @app.exception_handler(Exception)
+    async def generic_exception_handler(_: Request, exc: Exception):  # pragma: no cover
+        return JSONResponse(status_code=500, content={"error": {"code": 500, "message": str(exc)}})
+
+    @app.get("/")
+    async def index(request: Request) -> Response:
+        headers = {"ETag": _INDEX_ETAG, "Cache-Control": "public, max-age=300"}
+        if request.headers.get("if-none-match") == _INDEX_ETAG:
+            return Response(status_code=304, headers=headers)
+        return Response(content=_INDEX_BYTES, media_type="text/html", headers=headers)
 
     def _derive_output_name(orig_name: Optional[str]) -> str:
         if not orig_name:
@@ -176,116 +547,134 @@ def create_app(config: WebConfig) -> FastAPI:
         root, _ = os.path.splitext(base)
         return (root or "document") + ".md"
 
+    # Repeat uploads of the same document skip the converter entirely
+    conversion_cache = ConversionCache(maxsize=config.cache_size, ttl_seconds=config.cache_ttl_seconds)
+
+    async def _upload_digest(file: UploadFile) -> Optional[str]:
+        """Hash the upload for the cache key, leaving it rewound for conversion.
+
+        Starlette has already spooled the body (in memory up to 1 MiB, on disk beyond), so
+        the conversion reads that file directly rather than a second copy of it.
+        """
+        if not conversion_cache.enabled:
+            return None
+        hasher = content_hasher()
+        # One trip to the pool for the whole pass rather than an await per chunk
+        await _offload(_hash_upload, file.file, hasher)
+        file.file.seek(0)
+        return hasher.hexdigest()
+
     @app.post("/api/convert", dependencies=[Depends(require_api_key)])
     async def convert(
         file: UploadFile = File(...),
-        response: str = Query("download", pattern="^(download|compressed)$"),
+        response: ResponseMode = Query(ResponseMode.download),
         confirm: Optional[bool] = Query(default=None, description="Confirm proceeding when bulk thresholds exceeded"),
-        content_length: Optional[int] = Header(default=None, convert_underscores=False, alias="Content-Length"),
     ) -> Response:
-        # Enforce size limit using Content-Length when available
-        if content_length is not None and content_length > config.max_upload_bytes:
-            raise HTTPException(status_code=HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail="upload too large")
+        # Upload size is enforced by MaxBodySizeMiddleware before the body reaches us
+        # Decide whether this is an archive for bulk processing (currently support .zip)
+        is_zip = (file.filename or "").lower().endswith(".zip")
 
-        # Persist to a temporary file
         try:
-            with tempfile.NamedTemporaryFile(delete=False) as tmp:
-                tmp_path = tmp.name
-                while True:
-                    chunk = await file.read(1024 * 1024)
-                    if not chunk:
-                        break
-                    # Best-effort enforcement for clients without Content-Length
-                    if tmp.tell() + len(chunk) > config.max_upload_bytes:
-                        raise HTTPException(status_code=HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail="upload too large")
-                    tmp.write(chunk)
-
-            # Decide whether this is an archive for bulk processing (currently support .zip)
-            is_zip = (file.filename or "").lower().endswith(".zip")
+            conversion_slots.acquire_nowait()
+        except anyio.WouldBlock:
+            raise HTTPException(status_code=HTTP_503_SERVICE_UNAVAILABLE, detail="too many conversions in progress")
+        tmp_path: Optional[str] = None
+        try:
             if is_zip:
-                if bulk_convert is None or BulkConvertThresholds is None:
+                # Bulk extraction needs a real path on disk
+                with tempfile.NamedTemporaryFile(delete=False, suffix=".zip") as tmp:
+                    tmp_path = tmp.name
+                    await _offload(_copy_upload, file.file, tmp)
+
+                run_bulk = _bulk_runner()
+                if run_bulk is None:
                     raise HTTPException(status_code=HTTP_400_BAD_REQUEST, detail="bulk conversion not available")
 
-                extract_dir = tempfile.mkdtemp()
-                dest_dir = tempfile.mkdtemp()
+                extract_dir: Optional[str] = None
+                dest_dir: Optional[str] = None
+                streaming = False
                 try:
+                    extract_dir = tempfile.mkdtemp()
+                    dest_dir = tempfile.mkdtemp()
+
                     # Extract
-                    with zipfile.ZipFile(tmp_path, 'r') as zf:
-                        zf.extractall(extract_dir)
+                    await _offload(_extract_zip, tmp_path, extract_dir, config.use_io_uring)
 
                     # Run bulk conversion with default thresholds; confirm must be True when exceeded
-                    thresholds = BulkConvertThresholds(max_dirs=16, max_files=128, max_bytes=300*1024*1024)
-
-                    def _confirm_cb(stats, thres):  # type: ignore
-                        return bool(confirm)
-
-                    result_bulk = bulk_convert(
+                    result_bulk = await _offload(
+                        run_bulk,
                         root=extract_dir,
                         dest=dest_dir,
-                        on_conflict="rename",
-                        continue_on_error=True,
-                        thresholds=thresholds,
-                        confirm=_confirm_cb,
-                        skip_hidden=True,
+                        confirm=_confirmed if confirm else _not_confirmed,
+                        executor=app.state.bulk_pool,
                     )
 
-                    # Zip the dest_dir
-                    out_zip_path = tempfile.NamedTemporaryFile(delete=False, suffix=".zip").name
-                    with zipfile.ZipFile(out_zip_path, 'w', compression=zipfile.ZIP_DEFLATED) as outzip:
-                        for root_dir, _, files_in in os.walk(result_bulk.dest):
-                            for fn in files_in:
-                                full = Path(root_dir) / fn
-                                rel = full.relative_to(result_bulk.dest)
-                                outzip.write(full, arcname=str(rel))
-
-                    # Prepare response
+                    # Stream the zipped dest_dir; the response owns dest_dir from here on
                     out_name = (Path(file.filename).stem if file.filename else "converted") + "-md.zip"
                     headers = {
                         "Content-Disposition": f"attachment; filename=\"{out_name}\"",
-                        "Content-Type": "application/zip",
                     }
-                    with open(out_zip_path, 'rb') as fzip:
-                        data = fzip.read()
-                    return Response(content=data, headers=headers, media_type="application/zip")
+                    body = _iter_zip_dir(str(result_bulk.dest), cleanup=dest_dir)
+                    streaming = True
+                    return StreamingResponse(body, headers=headers, media_type="application/zip")
                 except Exception as e:
                     # For threshold confirmation failures, provide structured message
                     raise HTTPException(status_code=HTTP_400_BAD_REQUEST, detail=f"bulk conversion failed: {e}")
                 finally:
-                    try:
+                    if extract_dir is not None:
                         shutil.rmtree(extract_dir, ignore_errors=True)
-                    except Exception:
-                        pass
-                    try:
+                    if dest_dir is not None and not streaming:
                         shutil.rmtree(dest_dir, ignore_errors=True)
-                    except Exception:
-                        pass
             else:
-                # Single file conversion via MarkItDown's URI API
-                uri = f"file://{tmp_path}"
-                result = converter.convert_uri(uri)
-                markdown = result.markdown if hasattr(result, "markdown") else str(result)
+                # Single file conversion straight from Starlette's spooled upload, no copy
+                digest = await _upload_digest(file)
+                ext = os.path.splitext(file.filename or "")[1] or None
+                # The extension steers converter selection, so it is part of the key
+                cache_key = (digest, ext) if digest is not None else None
+                cached = conversion_cache.get(cache_key) if cache_key is not None else None
+                if cached is not None:
+                    markdown = cached
+                    cache_status = "HIT"
+                else:
+                    try:
+                        md = await _converter()
+                    except Exception as e:
+                        # A server-side setup problem, not something the client sent
+                        raise HTTPException(
+                            status_code=HTTP_503_SERVICE_UNAVAILABLE, detail=f"converter unavailable: {e}"
+                        )
+                    result = await _offload(md.convert_stream, file.file, file_extension=ext)
+                    markdown = result.markdown if hasattr(result, "markdown") else str(result)
+                    if cache_key is not None:
+                        conversion_cache.put(cache_key, markdown)
+                    cache_status = "MISS"
         except HTTPException:
             # Reraise cleanly
             raise
         except Exception as e:  # pragma: no cover
             raise HTTPException(status_code=HTTP_400_BAD_REQUEST, detail=f"conversion failed: {e}")
         finally:
-            try:
-                if 'tmp_path' in locals() and os.path.exists(tmp_path):
+            conversion_slots.release()
+            if tmp_path is not None:
+                with contextlib.suppress(FileNotFoundError):
                     os.unlink(tmp_path)
-            except Exception:
-                pass
 
         filename = _derive_output_name(file.filename)
 
-        if response == "download":
+        if response is ResponseMode.download:
             headers = {
                 "Content-Disposition": f"attachment; filename=\"{filename}\"",
                 "Content-Type": "text/markdown; charset=utf-8",
+                "X-Cache": cache_status,
             }
             return PlainTextResponse(markdown, headers=headers)
         else:
             # compressed mode: rely on GZipMiddleware, return inline markdown
-            return PlainTextResponse(markdown)
+            return PlainTextResponse(markdown, headers={"X-Cache": cache_status})
 
     return app
+
+
+def app_factory() -> FastAPI:
+    """Build the app from ``load_config()``; used by uvicorn's ``--factory`` multi-worker mode."""
+    return create_app(load_config())
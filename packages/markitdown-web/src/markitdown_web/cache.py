@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Hashable, Optional
+
+# BLAKE3 hashes large uploads several times faster than SHA-256; use it when installed
+try:
+    from blake3 import blake3 as _blake3  # type: ignore
+except Exception:  # pragma: no cover - optional speedup
+    _blake3 = None  # type: ignore
+
+content_hasher: Callable[[], "hashlib._Hash"] = _blake3 or hashlib.sha256  # type: ignore[assignment]
+
+
+class ConversionCache:
+    """Thread-safe LRU of converted markdown, keyed by upload content, with a per-entry TTL."""
+
+    def __init__(self, maxsize: int, ttl_seconds: float) -> None:
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[Hashable, tuple[float, str]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.maxsize > 0
+
+    def get(self, key: Hashable) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires, markdown = entry
+            if expires < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return markdown
+
+    def put(self, key: Hashable, markdown: str) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, markdown)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
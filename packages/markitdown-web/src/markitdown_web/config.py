@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Optional
+import functools
 import os
 
 try:  # Python 3.11+
@@ -17,29 +18,61 @@ class WebConfig:
     enable_plugins: bool = False
     log_level: str = "info"
     cors_origins: Optional[list[str]] = None
+    convert_workers: int = field(default_factory=lambda: min(32, 2 * (os.cpu_count() or 1)))
+    max_concurrent_conversions: int = 64
+    cache_size: int = 128
+    cache_ttl_seconds: int = 600
+    use_io_uring: bool = False
 
     @property
     def max_upload_bytes(self) -> int:
         return int(self.max_upload_mb) * 1024 * 1024
 
 
-def _env_bool(name: str, default: Optional[bool]) -> Optional[bool]:
-    v = os.getenv(name)
+# Every variable load_config reads; their values are part of the memoization key
+_ENV_VARS = (
+    "MARKITDOWN_WEB_API_KEY",
+    "MARKITDOWN_WEB_MAX_UPLOAD_MB",
+    "MARKITDOWN_ENABLE_PLUGINS",
+    "MARKITDOWN_WEB_LOG_LEVEL",
+    "MARKITDOWN_WEB_CONVERT_WORKERS",
+    "MARKITDOWN_WEB_MAX_CONCURRENT_CONVERSIONS",
+    "MARKITDOWN_WEB_CACHE_SIZE",
+    "MARKITDOWN_WEB_CACHE_TTL_SECONDS",
+    "MARKITDOWN_WEB_CORS_ORIGINS",
+    "MARKITDOWN_WEB_USE_IO_URING",
+)
+
+
+def _env_bool(v: Optional[str], default: Optional[bool]) -> Optional[bool]:
     if v is None:
         return default
     return v.strip().lower() in ("1", "true", "yes", "on")
 
 
 def load_config(config_path: Optional[str] = None) -> WebConfig:
+    env = os.environ
     # Determine config path: explicit argument, or env, else optional default in CWD
-    cfg_path = (
+    cfg_path = os.path.abspath(
         config_path
-        or os.getenv("MARKITDOWN_WEB_CONFIG")
+        or env.get("MARKITDOWN_WEB_CONFIG")
         or (os.path.join(os.getcwd(), "markitdown_web.toml"))
     )
+    # Repeat calls (tests, the --factory entry point) reuse the parsed result as long as
+    # the file and the environment are unchanged
+    try:
+        mtime: Optional[int] = os.stat(cfg_path).st_mtime_ns
+    except OSError:
+        mtime = None
+    return _load_config(cfg_path, mtime, tuple(env.get(name) for name in _ENV_VARS))
+
+
+@functools.lru_cache(maxsize=1)
+def _load_config(cfg_path: str, mtime: Optional[int], env_values: tuple[Optional[str], ...]) -> WebConfig:
+    env = {name: value for name, value in zip(_ENV_VARS, env_values) if value is not None}
 
     data: dict = {}
-    if os.path.isfile(cfg_path):
+    if mtime is not None and os.path.isfile(cfg_path):
         with open(cfg_path, "rb") as f:
             data = tomli.load(f) or {}
 
@@ -49,15 +82,27 @@ def load_config(config_path: Optional[str] = None) -> WebConfig:
     enable_plugins = bool(data.get("enable_plugins") or False)
     log_level = str(data.get("log_level") or "info")
     cors_origins = data.get("cors_origins")
+    convert_workers = int(data.get("convert_workers") or min(32, 2 * (os.cpu_count() or 1)))
+    max_concurrent_conversions = int(data.get("max_concurrent_conversions") or 64)
+    cache_size = int(data.get("cache_size", 128))
+    cache_ttl_seconds = int(data.get("cache_ttl_seconds") or 600)
+    use_io_uring = bool(data.get("use_io_uring") or False)
     if cors_origins is not None and not isinstance(cors_origins, list):
         cors_origins = None
 
     # Environment overrides
-    api_key = os.getenv("MARKITDOWN_WEB_API_KEY", api_key)
-    max_upload_mb = int(os.getenv("MARKITDOWN_WEB_MAX_UPLOAD_MB", max_upload_mb))
-    enable_plugins = _env_bool("MARKITDOWN_ENABLE_PLUGINS", enable_plugins) or False
-    log_level = os.getenv("MARKITDOWN_WEB_LOG_LEVEL", log_level)
-    cors_env = os.getenv("MARKITDOWN_WEB_CORS_ORIGINS")
+    api_key = env.get("MARKITDOWN_WEB_API_KEY", api_key)
+    max_upload_mb = int(env.get("MARKITDOWN_WEB_MAX_UPLOAD_MB", max_upload_mb))
+    enable_plugins = _env_bool(env.get("MARKITDOWN_ENABLE_PLUGINS"), enable_plugins) or False
+    log_level = env.get("MARKITDOWN_WEB_LOG_LEVEL", log_level)
+    convert_workers = int(env.get("MARKITDOWN_WEB_CONVERT_WORKERS", convert_workers))
+    max_concurrent_conversions = int(
+        env.get("MARKITDOWN_WEB_MAX_CONCURRENT_CONVERSIONS", max_concurrent_conversions)
+    )
+    cache_size = int(env.get("MARKITDOWN_WEB_CACHE_SIZE", cache_size))
+    cache_ttl_seconds = int(env.get("MARKITDOWN_WEB_CACHE_TTL_SECONDS", cache_ttl_seconds))
+    use_io_uring = _env_bool(env.get("MARKITDOWN_WEB_USE_IO_URING"), use_io_uring) or False
+    cors_env = env.get("MARKITDOWN_WEB_CORS_ORIGINS")
     if cors_env:
         cors_origins = [s.strip() for s in cors_env.split(",") if s.strip()]
 
@@ -73,4 +118,9 @@ def load_config(config_path: Optional[str] = None) -> WebConfig:
         enable_plugins=enable_plugins,
         log_level=log_level,
         cors_origins=cors_origins,
+        convert_workers=convert_workers,
+        max_concurrent_conversions=max_concurrent_conversions,
+        cache_size=cache_size,
+        cache_ttl_seconds=cache_ttl_seconds,
+        use_io_uring=use_io_uring,
     )
@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import zlib
+
+from fastapi import HTTPException
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import JSONResponse
+from starlette.status import HTTP_413_REQUEST_ENTITY_TOO_LARGE
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+# Media types that are already compressed; gzipping them again only burns CPU
+ALREADY_COMPRESSED_TYPES: tuple[str, ...] = ("application/zip", "image/", "video/")
+
+
+_HEALTHZ_BODY = b'{"status":"ok"}'
+
+
+class HealthzMiddleware:
+    """Answer liveness probes at ``path`` before routing or any other middleware runs.
+
+    Load balancers hit this many times a second, so the response is fixed bytes with no
+    validation, JSON encoding or compression in the way.
+    """
+
+    def __init__(self, app: ASGIApp, path: str = "/healthz") -> None:
+        self.app = app
+        self.path = path
+        self._headers = [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(_HEALTHZ_BODY)).encode("ascii")),
+            (b"cache-control", b"no-store"),
+        ]
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] != self.path or scope["method"] not in ("GET", "HEAD"):
+            await self.app(scope, receive, send)
+            return
+        await send({"type": "http.response.start", "status": 200, "headers": self._headers})
+        await send({"type": "http.response.body", "body": b"" if scope["method"] == "HEAD" else _HEALTHZ_BODY})
+
+
+class SelectiveGZipMiddleware:
+    """GZip responses for clients that accept it, skipping already-compressed media types.
+
+    Starlette's ``GZipMiddleware`` only learned to exclude content types in recent
+    releases, so we carry our own to get the same behavior on every supported version.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 500,
+        compresslevel: int = 9,
+        exclude_types: tuple[str, ...] = ALREADY_COMPRESSED_TYPES,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.compresslevel = compresslevel
+        self.exclude_types = exclude_types
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or "gzip" not in Headers(scope=scope).get("accept-encoding", ""):
+            await self.app(scope, receive, send)
+            return
+
+        start: Message = {}
+        compressor = None
+        passthrough = False
+
+        async def send_compressed(message: Message) -> None:
+            nonlocal start, compressor, passthrough
+            if message["type"] == "http.response.start":
+                # Hold the headers back until the first body chunk tells us whether to compress
+                start = message
+                return
+            if message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if passthrough:
+                await send(message)
+                return
+
+            if compressor is None:
+                headers = Headers(raw=start["headers"])
+                content_type = headers.get("content-type", "")
+                if (
+                    "content-encoding" in headers
+                    or content_type.startswith(self.exclude_types)
+                    or (not more_body and len(body) < self.minimum_size)
+                ):
+                    passthrough = True
+                    await send(start)
+                    await send(message)
+                    return
+
+                compressor = zlib.compressobj(self.compresslevel, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+                out = compressor.compress(body) + compressor.flush(zlib.Z_SYNC_FLUSH if more_body else zlib.Z_FINISH)
+                mutable = MutableHeaders(raw=start["headers"])
+                mutable["Content-Encoding"] = "gzip"
+                mutable.add_vary_header("Accept-Encoding")
+                if more_body:
+                    del mutable["Content-Length"]
+                else:
+                    mutable["Content-Length"] = str(len(out))
+                await send(start)
+                await send({"type": "http.response.body", "body": out, "more_body": more_body})
+                return
+
+            # Flush each chunk so streamed output reaches the client as it is produced
+            out = compressor.compress(body) + compressor.flush(zlib.Z_SYNC_FLUSH if more_body else zlib.Z_FINISH)
+            await send({"type": "http.response.body", "body": out, "more_body": more_body})
+
+        await self.app(scope, receive, send_compressed)
+
+
+class MaxBodySizeMiddleware:
+    """Reject request bodies larger than ``limit`` bytes while they are still arriving.
+
+    A declared Content-Length over the limit is refused before any body is read. The
+    bytes actually received are counted too, so clients that omit or understate the
+    length are cut off at the limit instead of after the upload has been spooled.
+    """
+
+    def __init__(self, app: ASGIApp, limit: int) -> None:
+        self.app = app
+        self.limit = limit
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        declared = Headers(scope=scope).get("content-length")
+        if declared is not None and declared.isdigit() and int(declared) > self.limit:
+            response = JSONResponse(
+                status_code=HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                content={"error": {"code": HTTP_413_REQUEST_ENTITY_TOO_LARGE, "message": "upload too large"}},
+            )
+            await response(scope, receive, send)
+            return
+
+        received = 0
+
+        async def limited_receive() -> Message:
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.limit:
+                    # FastAPI re-raises HTTPExceptions from body parsing, so this reaches
+                    # the app's handler and becomes the usual JSON error
+                    raise HTTPException(status_code=HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail="upload too large")
+            return message
+
+        await self.app(scope, limited_receive, send)
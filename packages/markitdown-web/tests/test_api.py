@@ -17,6 +17,9 @@ class FakeMarkItDown:
     def convert_uri(self, uri: str):  # noqa: D401
         return FakeResult(markdown=f"Converted: {uri}")
 
+    def convert_stream(self, stream, file_extension=None):  # noqa: D401
+        return FakeResult(markdown=f"Converted {file_extension}: {stream.read().decode()}")
+
 
 fake_module = types.ModuleType("markitdown")
 fake_module.MarkItDown = FakeMarkItDown
@@ -34,6 +37,22 @@ async def test_healthz():
         resp = await ac.get("/healthz")
         assert resp.status_code == 200
         assert resp.json()["status"] == "ok"
+        head = await ac.head("/healthz")
+        assert head.status_code == 200
+        assert head.content == b""
+
+
+@pytest.mark.anyio
+async def test_index_served_with_etag_and_revalidates():
+    app = create_app(WebConfig(api_key="key"))
+    async with AsyncClient(app=app, base_url="http://test") as ac:
+        resp = await ac.get("/")
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("text/html")
+        etag = resp.headers["etag"]
+        again = await ac.get("/", headers={"if-none-match": etag})
+        assert again.status_code == 304
+        assert again.content == b""
 
 
 @pytest.mark.anyio
@@ -57,7 +76,54 @@ async def test_convert_download_sets_attachment_header(tmp_path):
         assert r.headers["content-type"].startswith("text/markdown")
         cd = r.headers.get("content-disposition", "")
         assert "attachment" in cd and cd.endswith('"report.md"')
-        assert r.text.startswith("Converted: file://")
+        assert r.text == "Converted .pdf: %PDF-sample"
+
+
+@pytest.mark.anyio
+async def test_convert_sheds_load_when_all_slots_busy():
+    app = create_app(WebConfig(api_key="k", max_concurrent_conversions=0))
+    async with AsyncClient(app=app, base_url="http://test") as ac:
+        files = {"file": ("a.txt", b"hello")}
+        r = await ac.post("/api/convert", files=files, headers={"x-api-key": "k"})
+        assert r.status_code == 503
+        assert r.json()["error"]["code"] == 503
+
+
+@pytest.mark.anyio
+async def test_convert_reads_upload_spooled_to_disk():
+    # Past 1 MiB Starlette has rolled the upload over to disk; it is converted from there
+    app = create_app(WebConfig(api_key="k"))
+    body = b"spooled body " * (200 * 1024)
+    async with AsyncClient(app=app, base_url="http://test") as ac:
+        files = {"file": ("notes.txt", body)}
+        first = await ac.post("/api/convert", files=files, headers={"x-api-key": "k"})
+        second = await ac.post("/api/convert", files=files, headers={"x-api-key": "k"})
+        assert first.status_code == 200
+        assert first.text == "Converted .txt: " + body.decode()
+        assert second.headers["x-cache"] == "HIT"
+
+
+@pytest.mark.anyio
+async def test_repeat_upload_served_from_cache(monkeypatch):
+    app = create_app(WebConfig(api_key="k"))
+    calls = []
+    original = FakeMarkItDown.convert_stream
+
+    def counting_convert_stream(self, stream, file_extension=None):
+        calls.append(file_extension)
+        return original(self, stream, file_extension=file_extension)
+
+    monkeypatch.setattr(FakeMarkItDown, "convert_stream", counting_convert_stream)
+    async with AsyncClient(app=app, base_url="http://test") as ac:
+        files = {"file": ("a.txt", b"same bytes")}
+        first = await ac.post("/api/convert", files=files, headers={"x-api-key": "k"})
+        second = await ac.post("/api/convert", files=files, headers={"x-api-key": "k"})
+        other_ext = await ac.post("/api/convert", files={"file": ("a.csv", b"same bytes")}, headers={"x-api-key": "k"})
+        assert first.headers["x-cache"] == "MISS"
+        assert second.headers["x-cache"] == "HIT"
+        assert second.text == first.text
+        assert other_ext.headers["x-cache"] == "MISS"
+        assert calls == [".txt", ".csv"]
 
 
 @pytest.mark.anyio
@@ -72,6 +138,23 @@ async def test_convert_inline_compressed_mode(tmp_path):
         assert "attachment" not in (r.headers.get("content-disposition") or "")
 
 
+@pytest.mark.anyio
+async def test_converter_build_failure_answers_503(monkeypatch):
+    from markitdown_web import app as appmod
+
+    def broken_converter(enable_plugins):
+        raise RuntimeError("markitdown is not installed")
+
+    monkeypatch.setattr(appmod, "_new_converter", broken_converter)
+    app = create_app(WebConfig(api_key="k"))
+    # The startup build fails in the background without taking the lifespan down
+    async with app.router.lifespan_context(app):
+        async with AsyncClient(app=app, base_url="http://test") as ac:
+            r = await ac.post("/api/convert", files={"file": ("a.txt", b"x")}, headers={"x-api-key": "k"})
+            assert r.status_code == 503
+            assert "markitdown is not installed" in r.json()["error"]["message"]
+
+
 @pytest.mark.anyio
 async def test_max_size_enforced_via_content_length():
     app = create_app(WebConfig(api_key="k", max_upload_mb=1))
@@ -83,47 +166,142 @@ async def test_max_size_enforced_via_content_length():
         assert r.json()["error"]["code"] == 413
 
 
-    @pytest.mark.anyio
-    async def test_bulk_zip_upload_returns_zip(tmp_path, monkeypatch):
-        # Patch bulk_convert inside the app module to avoid invoking real converter
-        import types as _types
-        import zipfile as _zipfile
-        import os as _os
-        from markitdown_web import app as appmod
-
-        class DummyBulkResult:
-            def __init__(self, dest):
-                self.dest = dest
-
-        def fake_bulk_convert(root: str, dest: str, **kwargs):  # type: ignore
-            # Create a couple of markdown files in dest and a report
-            _os.makedirs(dest, exist_ok=True)
-            with open(_os.path.join(dest, "a.md"), "w", encoding="utf-8") as f:
-                f.write("A")
-            with open(_os.path.join(dest, "process_report.md"), "w", encoding="utf-8") as f:
-                f.write("report")
-            return DummyBulkResult(dest)
-
-        monkeypatch.setattr(appmod, "bulk_convert", fake_bulk_convert)
-        monkeypatch.setattr(appmod, "BulkConvertThresholds", object)
-
-        # Build a tiny zip upload with two files
-        upload_zip_path = tmp_path / "upload.zip"
-        with _zipfile.ZipFile(upload_zip_path, "w", compression=_zipfile.ZIP_DEFLATED) as z:
-            z.writestr("dir/x.txt", "hello")
-            z.writestr("y.pdf", "%PDF")
-
-        app = create_app(WebConfig(api_key="k"))
-        async with AsyncClient(app=app, base_url="http://test") as ac:
-            with open(upload_zip_path, "rb") as fz:
-                files = {"file": ("upload.zip", fz.read(), "application/zip")}
-            r = await ac.post("/api/convert?response=download&confirm=true", files=files, headers={"x-api-key": "k"})
-            assert r.status_code == 200
-            assert r.headers["content-type"].startswith("application/zip")
-            # validate zip has our files
-            from io import BytesIO
-            import zipfile
-            zf = zipfile.ZipFile(BytesIO(r.content))
-            names = set(zf.namelist())
-            assert "a.md" in names
-            assert "process_report.md" in names
+@pytest.mark.anyio
+async def test_oversized_upload_rejection_carries_cors_headers():
+    app = create_app(WebConfig(api_key="k", max_upload_mb=1, cors_origins=["http://ui.example"]))
+    async with AsyncClient(app=app, base_url="http://test") as ac:
+        files = {"file": ("big.bin", b"0" * (2 * 1024 * 1024))}
+        headers = {"x-api-key": "k", "origin": "http://ui.example"}
+        r = await ac.post("/api/convert", files=files, headers=headers)
+        assert r.status_code == 413
+        assert r.headers["access-control-allow-origin"] == "http://ui.example"
+
+
+@pytest.mark.anyio
+async def test_max_size_enforced_without_content_length():
+    app = create_app(WebConfig(api_key="k", max_upload_mb=1))
+    boundary = "testboundary"
+    payload = (
+        f'--{boundary}\r\nContent-Disposition: form-data; name="file"; filename="big.bin"\r\n\r\n'.encode()
+        + b"0" * (2 * 1024 * 1024)
+        + f"\r\n--{boundary}--\r\n".encode()
+    )
+
+    async def chunked():
+        # An async iterator body is sent chunked, without a Content-Length header
+        for i in range(0, len(payload), 64 * 1024):
+            yield payload[i : i + 64 * 1024]
+
+    async with AsyncClient(app=app, base_url="http://test") as ac:
+        headers = {"x-api-key": "k", "content-type": f"multipart/form-data; boundary={boundary}"}
+        r = await ac.post("/api/convert", content=chunked(), headers=headers)
+        assert r.status_code == 413
+        assert r.json()["error"]["code"] == 413
+
+
+@pytest.mark.anyio
+async def test_bulk_zip_upload_returns_zip(tmp_path, monkeypatch):
+    # Patch bulk_convert inside the app module to avoid invoking real converter
+    import types as _types
+    import zipfile as _zipfile
+    import os as _os
+    from markitdown_web import app as appmod
+
+    class DummyBulkResult:
+        def __init__(self, dest):
+            self.dest = dest
+
+    def fake_bulk_convert(root: str, dest: str, **kwargs):  # type: ignore
+        # Create a couple of markdown files in dest and a report
+        _os.makedirs(dest, exist_ok=True)
+        with open(_os.path.join(dest, "a.md"), "w", encoding="utf-8") as f:
+            f.write("A")
+        with open(_os.path.join(dest, "process_report.md"), "w", encoding="utf-8") as f:
+            f.write("report")
+        return DummyBulkResult(dest)
+
+    monkeypatch.setattr(appmod, "_bulk_runner", lambda: fake_bulk_convert)
+
+    # Build a tiny zip upload with two files
+    upload_zip_path = tmp_path / "upload.zip"
+    with _zipfile.ZipFile(upload_zip_path, "w", compression=_zipfile.ZIP_DEFLATED) as z:
+        z.writestr("dir/x.txt", "hello")
+        z.writestr("y.pdf", "%PDF")
+
+    app = create_app(WebConfig(api_key="k"))
+    async with AsyncClient(app=app, base_url="http://test") as ac:
+        with open(upload_zip_path, "rb") as fz:
+            files = {"file": ("upload.zip", fz.read(), "application/zip")}
+        r = await ac.post("/api/convert?response=download&confirm=true", files=files, headers={"x-api-key": "k"})
+        assert r.status_code == 200
+        assert r.headers["content-type"].startswith("application/zip")
+        # validate zip has our files
+        from io import BytesIO
+        import zipfile
+        zf = zipfile.ZipFile(BytesIO(r.content))
+        names = set(zf.namelist())
+        assert "a.md" in names
+        assert "process_report.md" in names
+
+
+@pytest.mark.anyio
+async def test_bulk_zip_rejects_paths_outside_archive(monkeypatch):
+    import io
+    import zipfile
+    from markitdown_web import app as appmod
+
+    def fake_bulk_convert(root: str, dest: str, **kwargs):  # type: ignore
+        raise AssertionError("bulk_convert must not run for unsafe archives")
+
+    monkeypatch.setattr(appmod, "_bulk_runner", lambda: fake_bulk_convert)
+
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as z:
+        z.writestr("../escape.txt", "nope")
+
+    app = create_app(WebConfig(api_key="k"))
+    async with AsyncClient(app=app, base_url="http://test") as ac:
+        files = {"file": ("evil.zip", buf.getvalue(), "application/zip")}
+        r = await ac.post("/api/convert?confirm=true", files=files, headers={"x-api-key": "k"})
+        assert r.status_code == 400
+        assert "unsafe path" in r.json()["error"]["message"]
+
+
+def test_extract_zip_with_io_uring_matches_regular_path(tmp_path):
+    # Falls back to the regular path when liburing or io_uring is unavailable
+    import zipfile
+    from markitdown_web import app as appmod
+
+    upload = tmp_path / "upload.zip"
+    big = b"x" * (appmod._URING_MAX_MEMBER + 1)
+    with zipfile.ZipFile(upload, "w", compression=zipfile.ZIP_DEFLATED) as z:
+        z.writestr("docs/", "")
+        z.writestr("docs/a.txt", "alpha")
+        z.writestr("deep/er/b.txt", "beta")
+        z.writestr("big.bin", big)
+
+    out = tmp_path / "out"
+    out.mkdir()
+    appmod._extract_zip(str(upload), str(out), use_io_uring=True)
+
+    assert (out / "docs" / "a.txt").read_bytes() == b"alpha"
+    assert (out / "deep" / "er" / "b.txt").read_bytes() == b"beta"
+    assert (out / "big.bin").read_bytes() == big
+
+
+@pytest.mark.parametrize("use_io_uring", [False, True])
+def test_extract_zip_duplicate_names_last_wins(tmp_path, use_io_uring):
+    import warnings
+    import zipfile
+    from markitdown_web import app as appmod
+
+    upload = tmp_path / "upload.zip"
+    with warnings.catch_warnings(), zipfile.ZipFile(upload, "w") as z:
+        warnings.simplefilter("ignore")  # zipfile warns about the duplicate names
+        for i in range(50):
+            z.writestr("dup.txt", f"version {i}" * 1000)
+
+    out = tmp_path / "out"
+    out.mkdir()
+    appmod._extract_zip(str(upload), str(out), use_io_uring=use_io_uring)
+    assert (out / "dup.txt").read_text() == "version 49" * 1000
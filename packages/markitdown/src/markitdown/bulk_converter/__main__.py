@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import argparse
+import os
 import sys
 from pathlib import Path
 from typing import Optional
@@ -35,10 +36,18 @@ def main(argv: Optional[list[str]] = None) -> int:
     p.add_argument("--enable-plugins", action="store_true", help="Enable markitdown plugins")
     p.add_argument("--no-continue-on-error", action="store_true", help="Stop on first error")
     p.add_argument("--no-skip-hidden", action="store_true", help="Include hidden files and directories")
+    p.add_argument("--follow-symlinks", action="store_true", help="Descend into symlinked directories")
+    p.add_argument("--sync", action="store_true", help="fsync outputs and their directories so results survive a crash")
     p.add_argument("--threshold-dirs", type=int, default=16, help="Max directories before confirmation is required")
     p.add_argument("--threshold-files", type=int, default=128, help="Max files before confirmation is required")
     p.add_argument("--threshold-mb", type=int, default=300, help="Max total size (MiB) before confirmation is required")
     p.add_argument("--yes", "-y", action="store_true", help="Auto-confirm running above thresholds")
+    p.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Convert files in this many processes (0 = one per CPU; default: 1, serial)",
+    )
 
     args = p.parse_args(argv)
 
@@ -64,12 +73,14 @@ def main(argv: Optional[list[str]] = None) -> int:
             include_ext=set(args.include) if args.include else None,
             exclude_ext=set(args.exclude) if args.exclude else None,
             on_conflict=args.on_conflict,  # type: ignore[arg-type]
-            workers=None,
+            workers=args.workers or os.cpu_count(),
             continue_on_error=not args.no_continue_on_error,
             enable_plugins=True if args.enable_plugins else None,
             thresholds=thresholds,
             confirm=confirm,
             skip_hidden=not args.no_skip_hidden,
+            follow_symlinks=args.follow_symlinks,
+            sync=args.sync,
         )
         print(result.to_summary())
         print(f"Report written to: {Path(result.dest) / 'process_report.md'}")
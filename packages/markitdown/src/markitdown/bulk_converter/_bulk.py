@@ -1,11 +1,17 @@
 from __future__ import annotations
 
-import io
+import contextlib
+import itertools
 import os
 import re
-from dataclasses import dataclass
+import sys
+import tempfile
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, replace
+from operator import itemgetter
 from pathlib import Path
-from typing import Callable, Iterable, Literal, Optional, Tuple
+from typing import AbstractSet, Callable, Iterable, Iterator, Literal, Optional, Tuple
 
 from .._base_converter import DocumentConverterResult
 from .._markitdown import MarkItDown
@@ -51,150 +57,466 @@ def _md_sibling_dest(root: Path) -> Path:
     return parent / name
 
 
-def _iter_files(root: Path, skip_hidden: bool) -> Iterable[Path]:
-    for dirpath, dirnames, filenames in os.walk(root):
-        dp = Path(dirpath)
-        if skip_hidden:
-            dirnames[:] = [d for d in dirnames if not d.startswith(".")]
-        for fn in filenames:
-            if skip_hidden and fn.startswith("."):
-                continue
-            yield dp / fn
-
-
-def _preflight(root: Path, skip_hidden: bool) -> PreflightStats:
+def _scan(
+    root: Path,
+    skip_hidden: bool,
+    include_ext: Optional[AbstractSet[str]] = None,
+    exclude_ext: Optional[AbstractSet[str]] = None,
+    filtered_out: Optional[list[tuple[str, str]]] = None,
+    follow_symlinks: bool = False,
+) -> tuple[PreflightStats, list[tuple[str, int, str]], int]:
+    """Walk ``root`` once, returning the preflight tallies, the files to convert, and how many
+    files the extension filters dropped.
+
+    Same traversal as ``os.walk``: top-down, files before subdirectories, symlinked
+    directories listed but not entered, unreadable directories ignored. The preflight
+    checks and the conversion loop share the result, so the tree is only read once.
+    Filtered files still count towards the preflight tallies but are dropped, unless
+    ``filtered_out`` is given to collect them.
+
+    Paths are returned as the plain strings ``scandir`` already built; callers wrap them
+    in ``Path`` only where they are handed out.
+
+    With ``follow_symlinks``, symlinked directories are entered too; each directory is
+    keyed by ``(st_dev, st_ino)`` so a link back up the tree (or a second link to the
+    same place) is visited only once.
+    """
     dirs = 0
-    files = 0
     total_bytes = 0
-    for dirpath, dirnames, filenames in os.walk(root):
-        if skip_hidden:
-            dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+    filtered = 0
+    files: list[tuple[str, int, str]] = []
+    visited: Optional[set[tuple[int, int]]] = None
+    if follow_symlinks:
+        st = os.stat(root)
+        visited = {(st.st_dev, st.st_ino)}
+    stack = [str(root)]
+    while stack:
+        dir_path = stack.pop()
+        try:
+            with os.scandir(dir_path) as it:
+                entries = list(it)
+        except OSError:
+            continue
         dirs += 1
-        files += len([f for f in filenames if not (skip_hidden and f.startswith("."))])
-        for f in filenames:
-            if skip_hidden and f.startswith("."):
+        subdirs: list[str] = []
+        for entry in entries:
+            if skip_hidden and entry.name.startswith("."):
                 continue
             try:
-                st = os.stat(os.path.join(dirpath, f))
-                total_bytes += int(st.st_size)
+                is_dir = entry.is_dir()
+            except OSError:
+                is_dir = False
+            if is_dir:
+                try:
+                    if visited is not None:
+                        # Reuses the stat behind is_dir() for links; one lstat for real dirs
+                        st = entry.stat()
+                        key = (st.st_dev, st.st_ino)
+                        if key not in visited:
+                            visited.add(key)
+                            subdirs.append(entry.path)
+                    elif not entry.is_symlink():
+                        subdirs.append(entry.path)
+                except OSError:
+                    pass
+                continue
+            try:
+                # d_type and, on Windows, the size come with the directory listing
+                size = entry.stat().st_size
             except OSError:
                 # If file disappears or is unreadable, ignore for size tally
-                pass
-    return PreflightStats(root=root, dirs=dirs, files=files, bytes=total_bytes)
+                size = 0
+            total_bytes += size
+            ext = _ext_of_name(entry.name)
+            if (include_ext and ext not in include_ext) or (exclude_ext and ext in exclude_ext):
+                filtered += 1
+                if filtered_out is not None:
+                    filtered_out.append((entry.path, ext))
+                continue
+            files.append((entry.path, size, ext))
+        stack.extend(reversed(subdirs))
+    stats = PreflightStats(root=root, dirs=dirs, files=len(files) + filtered, bytes=total_bytes)
+    return stats, files, filtered
+
+
+def _ext_of_name(name: str) -> str:
+    # Same rule as PurePath.suffix (a leading dot or a trailing dot is not a suffix),
+    # without building a Path
+    # Interned: every result shares one string per extension, and set lookups against
+    # the interned filters hit the identity fast path
+    i = name.rfind(".")
+    return sys.intern(name[i + 1 :].lower()) if 0 < i < len(name) - 1 else ""
 
 
 def _ext_of(path: Path) -> str:
-    return path.suffix.lower().lstrip(".")
+    return _ext_of_name(path.name)
 
 
-def _derive_output_path(src: Path, root: Path, dest_root: Path) -> Path:
-    rel = src.relative_to(root)
-    target = dest_root / rel
-    return target.with_suffix(".md")
+def _dir_prefix(path: Path) -> str:
+    s = str(path)
+    return s if s.endswith(os.sep) else s + os.sep
 
 
-def _unique_path(p: Path) -> Path:
-    if not p.exists():
-        return p
-    stem = p.stem
-    suffix = p.suffix
-    parent = p.parent
+def _derive_output_path(src: str, root_len: int, dest_prefix: str) -> str:
+    """Map a source file under the root to its ``.md`` path under the destination.
+
+    ``src`` must start with the root prefix (``root_len`` characters, separator included);
+    the result matches ``(dest_root / src.relative_to(root)).with_suffix(".md")``.
+    """
+    rel = src[root_len:]
+    dot = rel.rfind(".")
+    # Only a dot inside the last component, neither leading nor trailing, starts a suffix
+    if dot > rel.rfind(os.sep) + 1 and dot < len(rel) - 1:
+        rel = rel[:dot]
+    return dest_prefix + rel + ".md"
+
+
+_UNIQUE_SUFFIX_RE = re.compile(r" \((\d+)\)$")
+
+
+def _folds_case(directory: Path) -> bool:
+    """Whether ``directory`` matches names case-insensitively (the macOS and Windows defaults)."""
+    fd, probe = tempfile.mkstemp(prefix=".markitdown-case-", dir=directory)
+    os.close(fd)
+    try:
+        head, tail = os.path.split(probe)
+        return os.path.exists(os.path.join(head, tail.swapcase()))
+    finally:
+        os.unlink(probe)
+
+
+def _existing_names(parent: str, cache: dict[str, set[str]], key: Callable[[str], str] = os.path.normcase) -> set[str]:
+    """Names in ``parent``, read with one scandir and then kept up to date by the caller.
+
+    Names are stored as ``key(name)``; on a case-insensitive destination ``key`` folds
+    case so ``Report.md`` and ``report.md`` count as the same output.
+    """
+    names = cache.get(parent)
+    if names is None:
+        try:
+            with os.scandir(parent) as it:
+                names = {key(entry.name) for entry in it}
+        except FileNotFoundError:
+            names = set()
+        cache[parent] = names
+    return names
+
+
+def _unique_name(name: str, existing: AbstractSet[str], key: Callable[[str], str] = os.path.normcase) -> str:
+    # ``existing`` also holds outputs claimed by writes that may not have reached the disk yet
+    if key(name) not in existing:
+        return name
+    # Same split as PurePath.stem/suffix
+    dot = name.rfind(".")
+    if 0 < dot < len(name) - 1:
+        stem, suffix = name[:dot], name[dot:]
+    else:
+        stem, suffix = name, ""
     i = 1
-    pattern = re.compile(r" \((\d+)\)$")
     base_stem = stem
-    m = pattern.search(stem)
+    m = _UNIQUE_SUFFIX_RE.search(stem)
     if m:
         base_stem = stem[: m.start()]
     while True:
-        cand = parent / f"{base_stem} ({i}){suffix}"
-        if not cand.exists():
-            return cand
+        name = f"{base_stem} ({i}){suffix}"
+        if key(name) not in existing:
+            return name
         i += 1
 
 
+# A line whose first non-blank character is "#"
+_HEADING_RE = re.compile(r"^[^\S\n]*#", re.MULTILINE)
+
+
 def _count_words_and_headings(markdown: str) -> Tuple[int, int]:
+    # str.split() stays: it beats an \S+ regex several times over on large documents
     words = len(markdown.split())
-    headings = sum(1 for line in markdown.splitlines() if line.lstrip().startswith("#"))
+    # Matching heading starts in place avoids materializing every line via splitlines()
+    headings = len(_HEADING_RE.findall(markdown))
     return words, headings
 
 
-def _write_atomic(dest_path: Path, data: str) -> None:
-    dest_path.parent.mkdir(parents=True, exist_ok=True)
+# Writes run on a small thread pool so the next conversion overlaps the previous file's
+# I/O; past this many queued outputs the loop waits rather than holding more markdown
+_WRITE_WORKERS = 4
+_MAX_PENDING_WRITES = 16
+_WRITE_CHUNK_CHARS = 64 * 1024
+# Up to this size a document is encoded in one go and handed to a single write
+_WRITE_SINGLE_SHOT_CHARS = 1024 * 1024
+# Outputs below one filesystem block go straight to a new file: a single write leaves
+# nothing half-written for the tmp + rename dance to hide
+_DIRECT_WRITE_MAX_BYTES = 4096
+
+# (markdown, words, headings, error) for one source file
+_Outcome = Tuple[Optional[str], int, int, Optional[str]]
+
+# One converter per worker process (or thread pool), reused across tasks
+_worker_converters: dict[Optional[bool], MarkItDown] = {}
+
+
+def _new_converter(enable_plugins: Optional[bool]) -> MarkItDown:
+    return MarkItDown(enable_plugins=enable_plugins) if enable_plugins is not None else MarkItDown()
+
+
+def _convert_file(converter: MarkItDown, path: str) -> _Outcome:
+    try:
+        doc: DocumentConverterResult = converter.convert_local(path)
+        md_text = doc.markdown if hasattr(doc, "markdown") else str(doc)
+    except Exception as e:
+        # Exceptions may not pickle across processes; the message is all we report anyway
+        return None, 0, 0, str(e)
+    words, headings = _count_words_and_headings(md_text)
+    return md_text, words, headings, None
+
+
+def _convert_in_worker(path: str, enable_plugins: Optional[bool]) -> _Outcome:
+    converter = _worker_converters.get(enable_plugins)
+    if converter is None:
+        converter = _worker_converters[enable_plugins] = _new_converter(enable_plugins)
+    return _convert_file(converter, path)
+
+
+def _write_all(fd: int, buf: bytes) -> None:
+    # os.write may write short (signals, pipes, some network filesystems)
+    view = memoryview(buf)
+    while view:
+        view = view[os.write(fd, view) :]
+
+
+def _ensure_parent(dest_path: Path, known_dirs: Optional[set[Path]]) -> None:
+    # ``known_dirs`` remembers directories already created during this run
+    parent = dest_path.parent
+    if known_dirs is None or parent not in known_dirs:
+        parent.mkdir(parents=True, exist_ok=True)
+        if known_dirs is not None:
+            known_dirs.add(parent)
+
+
+class _NameTaken(Exception):
+    """An output's claimed name turned out to be in use when the file was created."""
+
+
+def _write_output(dest_path: Path, data: str, known_dirs: Optional[set[Path]] = None, sync: bool = False) -> None:
+    """Write one converted document to a name the caller has claimed as free; ``sync``
+    fsyncs the data before the file is published.
+
+    Raises ``_NameTaken`` rather than overwriting if the name is taken after all, so the
+    caller can apply the conflict policy again.
+    """
+    if len(data) < _DIRECT_WRITE_MAX_BYTES:
+        buf = data.encode("utf-8")
+        if len(buf) < _DIRECT_WRITE_MAX_BYTES:
+            _ensure_parent(dest_path, known_dirs)
+            try:
+                # O_EXCL: never clobber something that appeared there since the scan
+                fd = os.open(dest_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0), 0o666)
+            except FileExistsError:
+                raise _NameTaken(dest_path) from None
+            try:
+                _write_all(fd, buf)
+                if sync:
+                    os.fsync(fd)
+            finally:
+                os.close(fd)
+            return
+    _write_atomic(dest_path, data, known_dirs, exclusive=True, sync=sync)
+
+
+def _write_renamed(
+    dest_path: Path,
+    data: str,
+    dest_names: dict[str, set[str]],
+    key: Callable[[str], str],
+    known_dirs: Optional[set[Path]],
+    sync: bool = False,
+) -> Path:
+    """Write ``data`` under the next free variant of ``dest_path``'s name, which was taken."""
+    existing = _existing_names(str(dest_path.parent), dest_names, key)
+    while True:
+        name = _unique_name(dest_path.name, existing, key)
+        existing.add(key(name))
+        dest_path = dest_path.with_name(name)
+        try:
+            _write_output(dest_path, data, known_dirs, sync)
+            return dest_path
+        except _NameTaken:
+            continue
+
+
+def _write_atomic(
+    dest_path: Path,
+    data: str,
+    known_dirs: Optional[set[Path]] = None,
+    exclusive: bool = False,
+    sync: bool = False,
+) -> None:
+    """Write through a temp file renamed into place; ``exclusive`` raises ``_NameTaken``
+    instead of replacing an existing file, and ``sync`` fsyncs the data before the rename."""
+    _ensure_parent(dest_path, known_dirs)
     tmp = dest_path.with_suffix(dest_path.suffix + ".tmp")
-    with io.open(tmp, "w", encoding="utf-8", newline="") as f:
-        f.write(data)
-    os.replace(tmp, dest_path)
+    fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o666)
+    try:
+        if len(data) <= _WRITE_SINGLE_SHOT_CHARS:
+            _write_all(fd, data.encode("utf-8"))
+        else:
+            # Encode in slices so a large document never exists twice in memory (str + bytes)
+            for start in range(0, len(data), _WRITE_CHUNK_CHARS):
+                _write_all(fd, data[start : start + _WRITE_CHUNK_CHARS].encode("utf-8"))
+        if sync:
+            os.fsync(fd)
+    finally:
+        os.close(fd)
+    if not exclusive:
+        os.replace(tmp, dest_path)
+        return
+    try:
+        _publish_exclusive(tmp, dest_path)
+    except BaseException:
+        with contextlib.suppress(FileNotFoundError):
+            os.unlink(tmp)
+        raise
+
+
+def _publish_exclusive(tmp: Path, dest_path: Path) -> None:
+    # A hard link fails if the name exists, which os.replace would silently overwrite
+    try:
+        os.link(tmp, dest_path)
+    except FileExistsError:
+        raise _NameTaken(dest_path) from None
+    except OSError:
+        # No hard links on this filesystem: claim the name with an empty placeholder first
+        try:
+            os.close(os.open(dest_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666))
+        except FileExistsError:
+            raise _NameTaken(dest_path) from None
+        os.replace(tmp, dest_path)
+        return
+    os.unlink(tmp)
+
+
+def _sync_dirs(dirs: Iterable[Path]) -> None:
+    """fsync each directory once so the entries created in it survive a crash (POSIX only)."""
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+    for d in dirs:
+        try:
+            fd = os.open(d, os.O_RDONLY | os.O_DIRECTORY)
+        except OSError:
+            continue
+        try:
+            os.fsync(fd)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+
+class _DirAgg:
+    """Per-source-directory tallies for the report."""
+
+    __slots__ = ("docs", "words", "headings", "counts")
+
+    def __init__(self) -> None:
+        self.docs = 0
+        self.words = 0
+        self.headings = 0
+        self.counts: dict[str, int] = {}
 
 
 def _make_report(result: BulkResult) -> str:
     # Build per-directory statistics
-    from collections import defaultdict
-
-    per_dir_counts: dict[Path, dict[str, int]] = defaultdict(lambda: defaultdict(int))
-    per_dir_docs: dict[Path, int] = defaultdict(int)
-    per_dir_words: dict[Path, int] = defaultdict(int)
-    per_dir_headings: dict[Path, int] = defaultdict(int)
+    agg: dict[Path, _DirAgg] = {}
     errors: list[Tuple[Path, str]] = []
 
     for fr in result.files:
-        d = (fr.dest or result.dest).parent if fr.dest else (result.dest)
-        src_dir = fr.src.parent
         if fr.status == "converted" and fr.dest:
-            per_dir_counts[src_dir][_ext_of(fr.src)] += 1
-            per_dir_docs[src_dir] += 1
+            src_dir = fr.src.parent
+            a = agg.get(src_dir)
+            if a is None:
+                a = agg[src_dir] = _DirAgg()
+            ext = fr.ext if fr.ext is not None else _ext_of(fr.src)
+            a.counts[ext] = a.counts.get(ext, 0) + 1
+            a.docs += 1
             if fr.words:
-                per_dir_words[src_dir] += fr.words
+                a.words += fr.words
             if fr.headings:
-                per_dir_headings[src_dir] += fr.headings
+                a.headings += fr.headings
         elif fr.status == "failed":
             errors.append((fr.src, fr.reason or "unknown error"))
 
-    lines: list[str] = []
-    lines.append(f"# Bulk Conversion Report\n")
-    lines.append(f"Root: {result.root}\n")
-    lines.append(f"Destination: {result.dest}\n")
-    lines.append("")
-    lines.append(f"## Summary\n")
-    lines.append(f"- Converted: {result.converted}")
-    lines.append(f"- Skipped: {result.skipped}")
-    lines.append(f"- Failed: {result.failed}")
-    lines.append(f"- Total words: {result.total_words}")
-    lines.append(f"- Total headings: {result.total_headings}\n")
-    lines.append("")
-    lines.append("## By Directory\n")
-    for d in sorted(per_dir_docs.keys(), key=lambda p: str(p)):
-        lines.append(f"### {d}")
-        counts = per_dir_counts[d]
-        if counts:
-            lines.append("- Files converted by type:")
-            for ext, cnt in sorted(counts.items()):
-                lines.append(f"  - .{ext}: {cnt}")
-        lines.append(f"- Documents: {per_dir_docs[d]}")
-        lines.append(f"- Words: {per_dir_words[d]}")
-        lines.append(f"- Headings: {per_dir_headings[d]}\n")
+    # One string per section, each ending in its own newline, joined once at the end
+    blocks: list[str] = [
+        "# Bulk Conversion Report\n\n"
+        f"Root: {result.root}\n\n"
+        f"Destination: {result.dest}\n\n"
+        "\n"
+        "## Summary\n\n"
+        f"- Converted: {result.converted}\n"
+        f"- Skipped: {result.skipped}\n"
+        f"- Failed: {result.failed}\n"
+        f"- Total words: {result.total_words}\n"
+        f"- Total headings: {result.total_headings}\n\n"
+        "\n"
+        "## By Directory\n\n"
+    ]
+    # str() each directory once up front rather than leaving it to the sort key
+    for d, a in sorted(((str(src_dir), a) for src_dir, a in agg.items()), key=itemgetter(0)):
+        counts = a.counts
+        by_type = (
+            "- Files converted by type:\n" + "".join(f"  - .{ext}: {cnt}\n" for ext, cnt in sorted(counts.items()))
+            if counts
+            else ""
+        )
+        blocks.append(
+            f"### {d}\n"
+            f"{by_type}"
+            f"- Documents: {a.docs}\n"
+            f"- Words: {a.words}\n"
+            f"- Headings: {a.headings}\n\n"
+        )
 
     if errors:
-        lines.append("## Errors\n")
-        for src, reason in errors:
-            lines.append(f"- {src}: {reason}")
+        blocks.append("## Errors\n\n")
+        blocks.extend(f"- {src}: {reason}\n" for src, reason in errors)
 
-    return "\n".join(lines) + "\n"
+    return "".join(blocks)
 
 
 def bulk_convert(
     root: str | Path,
     dest: str | Path | None = None,
     *,
-    include_ext: Optional[set[str]] = None,
-    exclude_ext: Optional[set[str]] = None,
+    include_ext: Optional[AbstractSet[str]] = None,
+    exclude_ext: Optional[AbstractSet[str]] = None,
     on_conflict: ConflictPolicy = "rename",
-    workers: Optional[int] = None,  # kept for future use; current impl is serial
+    workers: Optional[int] = None,
     continue_on_error: bool = True,
     enable_plugins: Optional[bool] = None,
     thresholds: Optional[BulkConvertThresholds] = None,
     confirm: Optional[Callable[[PreflightStats, BulkConvertThresholds], bool]] = None,
     skip_hidden: bool = True,
+    executor: Optional[Executor] = None,
+    record_filtered: bool = False,
+    follow_symlinks: bool = False,
+    sync: bool = False,
 ) -> BulkResult:
+    """Convert every file under ``root`` to Markdown, mirroring the tree under ``dest``.
+
+    With ``workers`` > 1, conversions run on a process pool of that size created for this
+    call; ``None`` or 1 converts serially in-process. Callers converting repeatedly can pass
+    a long-lived ``executor`` instead, which takes precedence over ``workers``. Either way
+    each worker keeps its own ``MarkItDown`` instance between tasks.
+
+    Files dropped by ``include_ext``/``exclude_ext`` are counted in ``skipped``; pass
+    ``record_filtered=True`` to also get a ``"filtered"`` entry for each in ``files``.
+
+    Symlinked directories are not entered unless ``follow_symlinks`` is set; cycles are
+    detected either way.
+
+    With ``sync``, each output's data is fsynced before it is published and every
+    destination directory once at the end, so the outputs survive a crash; leave it off
+    for throwaway destinations.
+    """
     src_root = Path(root).resolve()
     if not src_root.exists() or not src_root.is_dir():
         raise NotADirectoryError(f"Root path does not exist or is not a directory: {src_root}")
@@ -204,8 +526,21 @@ def bulk_convert(
 
     thresholds = thresholds or BulkConvertThresholds()
 
-    # Preflight
-    stats = _preflight(src_root, skip_hidden=skip_hidden)
+    if include_ext:
+        include_ext = frozenset(sys.intern(e.lower().lstrip('.')) for e in include_ext)
+    if exclude_ext:
+        exclude_ext = frozenset(sys.intern(e.lower().lstrip('.')) for e in exclude_ext)
+
+    # Preflight; the same scan feeds the conversion loop below
+    filtered_out: Optional[list[tuple[str, str]]] = [] if record_filtered else None
+    stats, scanned, filtered = _scan(
+        src_root,
+        skip_hidden=skip_hidden,
+        include_ext=include_ext,
+        exclude_ext=exclude_ext,
+        filtered_out=filtered_out,
+        follow_symlinks=follow_symlinks,
+    )
     exceeded = (
         stats.dirs > thresholds.max_dirs
         or stats.files > thresholds.max_files
@@ -219,56 +554,130 @@ def bulk_convert(
             # No way to confirm -> raise informative exception
             raise PreflightExceeded(stats, thresholds)
 
-    if include_ext:
-        include_ext = {e.lower().lstrip('.') for e in include_ext}
-    if exclude_ext:
-        exclude_ext = {e.lower().lstrip('.') for e in exclude_ext}
-
-    converter = MarkItDown(enable_plugins=enable_plugins) if enable_plugins is not None else MarkItDown()
-
-    results: list[BulkFileResult] = []
-    converted = skipped = failed = 0
+    results: list[BulkFileResult] = [
+        BulkFileResult(src=Path(file_path), dest=None, status="skipped", reason="filtered", ext=ext)
+        for file_path, ext in filtered_out or ()
+    ]
+    converted = failed = 0
+    # Filtered files count as skipped whether or not they get individual records
+    skipped = filtered
     total_words = total_headings = 0
 
-    for file_path in _iter_files(src_root, skip_hidden=skip_hidden):
-        if include_ext and _ext_of(file_path) not in include_ext:
-            results.append(BulkFileResult(src=file_path, dest=None, status="skipped", reason="filtered"))
-            skipped += 1
-            continue
-        if exclude_ext and _ext_of(file_path) in exclude_ext:
-            results.append(BulkFileResult(src=file_path, dest=None, status="skipped", reason="filtered"))
-            skipped += 1
-            continue
-
-        out_path = _derive_output_path(file_path, src_root, dest_root)
-        try:
-            doc: DocumentConverterResult = converter.convert_local(str(file_path))
-            md_text = doc.markdown if hasattr(doc, "markdown") else str(doc)
-            words, headings = _count_words_and_headings(md_text)
-
-            final_out = out_path
-            if on_conflict == "rename":
-                final_out = _unique_path(final_out)
-            elif on_conflict == "skip" and final_out.exists():
-                results.append(BulkFileResult(src=file_path, dest=None, status="skipped", reason="exists"))
-                skipped += 1
+    candidates: list[tuple[str, str]] = [(file_path, ext) for file_path, _size, ext in scanned]
+    root_len = len(_dir_prefix(src_root))
+    dest_prefix = _dir_prefix(dest_root)
+
+    # Conversion is CPU-bound and can fan out to an executor; naming and writing stay here so
+    # conflict resolution sees every output in order
+    outcomes: Iterator[_Outcome]
+    owned_pool: Optional[ProcessPoolExecutor] = None
+    if executor is None and workers is not None and workers > 1 and len(candidates) > 1:
+        executor = owned_pool = ProcessPoolExecutor(max_workers=workers)
+    if executor is not None:
+        outcomes = executor.map(
+            _convert_in_worker,
+            [p for p, _ in candidates],
+            itertools.repeat(enable_plugins),
+            chunksize=8,
+        )
+    else:
+        converter = _new_converter(enable_plugins)
+        outcomes = (_convert_file(converter, p) for p, _ in candidates)
+
+    write_pool = ThreadPoolExecutor(max_workers=_WRITE_WORKERS, thread_name_prefix="bulk-write")
+    # (index into results, write future, markdown, words, headings), oldest first
+    pending: deque[tuple[int, Future, str, int, int]] = deque()
+    # Output names per destination directory, including ones claimed by queued writes
+    dest_names: dict[str, set[str]] = {}
+    name_key: Callable[[str], str] = str.lower if _folds_case(dest_root) else os.path.normcase
+    # dest_root was created above; subdirectories are added as writes create them
+    known_dirs: set[Path] = {dest_root}
+    stop = False
+
+    def _settle(limit: int) -> None:
+        """Record finished writes in order, waiting while more than ``limit`` are queued."""
+        nonlocal converted, failed, skipped, total_words, total_headings, stop
+        while pending and (len(pending) > limit or pending[0][1].done()):
+            index, future, md_text, words, headings = pending.popleft()
+            try:
+                try:
+                    future.result()
+                except _NameTaken:
+                    prev = results[index]
+                    if on_conflict == "skip":
+                        results[index] = BulkFileResult(src=prev.src, dest=None, status="skipped", reason="exists", ext=prev.ext)
+                        skipped += 1
+                        continue
+                    renamed = _write_renamed(prev.dest, md_text, dest_names, name_key, known_dirs, sync)
+                    results[index] = replace(prev, dest=renamed)
+            except Exception as e:
+                failed += 1
+                prev = results[index]
+                results[index] = BulkFileResult(src=prev.src, dest=None, status="failed", reason=str(e), ext=prev.ext)
+                if not continue_on_error:
+                    stop = True
                 continue
-
-            _write_atomic(final_out, md_text)
-            results.append(BulkFileResult(src=file_path, dest=final_out, status="converted", words=words, headings=headings))
             converted += 1
             total_words += words
             total_headings += headings
-        except Exception as e:
-            failed += 1
-            results.append(BulkFileResult(src=file_path, dest=None, status="failed", reason=str(e)))
-            if not continue_on_error:
+
+    try:
+        for (file_path, ext), (md_text, words, headings, error) in zip(candidates, outcomes):
+            _settle(_MAX_PENDING_WRITES)
+            if stop:
                 break
+            src_path = Path(file_path)
+            if error is not None or md_text is None:
+                failed += 1
+                results.append(BulkFileResult(src=src_path, dest=None, status="failed", reason=error, ext=ext))
+                if not continue_on_error:
+                    break
+                continue
+
+            # Destination path arithmetic stays on strings; one Path is built for the result
+            out_dir, _, out_name = _derive_output_path(file_path, root_len, dest_prefix).rpartition(os.sep)
+            try:
+                existing = _existing_names(out_dir or os.sep, dest_names, name_key)
+                if on_conflict == "rename":
+                    out_name = _unique_name(out_name, existing, name_key)
+                elif on_conflict == "skip" and name_key(out_name) in existing:
+                    results.append(BulkFileResult(src=src_path, dest=None, status="skipped", reason="exists", ext=ext))
+                    skipped += 1
+                    continue
+            except Exception as e:
+                failed += 1
+                results.append(BulkFileResult(src=src_path, dest=None, status="failed", reason=str(e), ext=ext))
+                if not continue_on_error:
+                    break
+                continue
+
+            # Recorded as converted now; _settle swaps in a failure if the write raises
+            existing.add(name_key(out_name))
+            final_out = Path(out_dir + os.sep + out_name)
+            write = write_pool.submit(_write_output, final_out, md_text, known_dirs, sync)
+            pending.append((len(results), write, md_text, words, headings))
+            results.append(
+                BulkFileResult(src=src_path, dest=final_out, status="converted", words=words, headings=headings, ext=ext)
+            )
+            if not continue_on_error:
+                # Let the write finish so a failure stops the run before the next file
+                _settle(0)
+                if stop:
+                    break
+        _settle(0)
+    finally:
+        # Stop feeding the executor if we bailed out early
+        close = getattr(outcomes, "close", None)
+        if close is not None:
+            close()
+        if owned_pool is not None:
+            owned_pool.shutdown(cancel_futures=True)
+        write_pool.shutdown()
 
     bulk = BulkResult(
         root=src_root,
         dest=dest_root,
-        files=results,
+        files=tuple(results),
         converted=converted,
         skipped=skipped,
         failed=failed,
@@ -278,6 +687,9 @@ def bulk_convert(
 
     # Write process_report.md into dest root
     report_text = _make_report(bulk)
-    _write_atomic(dest_root / "process_report.md", report_text)
+    _write_atomic(dest_root / "process_report.md", report_text, known_dirs, sync=sync)
+    if sync:
+        # Every directory we wrote into, synced once for the whole run instead of per file
+        _sync_dirs(known_dirs)
 
     return bulk
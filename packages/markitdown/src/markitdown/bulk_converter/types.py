@@ -8,7 +8,7 @@ from typing import Literal, Optional
 Status = Literal["converted", "skipped", "failed"]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BulkFileResult:
     src: Path
     dest: Optional[Path]
@@ -16,13 +16,15 @@ class BulkFileResult:
     reason: Optional[str] = None
     words: Optional[int] = None
     headings: Optional[int] = None
+    # Lowercased extension without the dot, as used for filtering; None if not recorded
+    ext: Optional[str] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BulkResult:
     root: Path
     dest: Path
-    files: list[BulkFileResult]
+    files: tuple[BulkFileResult, ...]
     converted: int
     skipped: int
     failed: int
@@ -1,4 +1,5 @@
 import sys
+import time
 import types
 from pathlib import Path
 
@@ -26,6 +27,7 @@ def _patch_bulk_markitdown(monkeypatch):
     import markitdown.bulk_converter._bulk as bc
 
     monkeypatch.setattr(bc, "MarkItDown", FakeMarkItDown)
+    monkeypatch.setattr(bc, "_worker_converters", {})
     yield
 
 
@@ -63,6 +65,68 @@ def test_bulk_basic(tmp_path: Path):
     assert res.converted == 3
 
 
+def test_sync_is_opt_in(monkeypatch, tmp_path: Path):
+    import os
+
+    import markitdown.bulk_converter._bulk as bc
+    from markitdown.bulk_converter import bulk_convert
+
+    synced = []
+    fsynced = []
+    monkeypatch.setattr(bc, "_sync_dirs", lambda dirs: synced.append(set(dirs)))
+    monkeypatch.setattr(os, "fsync", fsynced.append)
+    src = tmp_path / "src"
+    src.mkdir()
+    _make_tree(src)
+
+    bulk_convert(src, dest=tmp_path / "out")
+    assert (synced, fsynced) == ([], [])
+    bulk_convert(src, dest=tmp_path / "durable", sync=True)
+    assert synced == [{tmp_path / "durable", tmp_path / "durable" / "a", tmp_path / "durable" / "b"}]
+    # Three outputs and the report
+    assert len(fsynced) == 4
+
+
+def test_bulk_with_executor(tmp_path: Path):
+    from concurrent.futures import ThreadPoolExecutor
+
+    from markitdown.bulk_converter import bulk_convert
+
+    src = tmp_path / "src"
+    src.mkdir()
+    _make_tree(src)
+
+    dest = tmp_path / "out"
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        res = bulk_convert(src, dest=dest, executor=pool)
+
+    assert (dest / "a" / "f1.md").read_text(encoding="utf-8").startswith("#f1.txt")
+    assert (dest / "b" / "g.md").exists()
+    assert res.converted == 3
+    assert res.total_headings == 3
+
+
+def test_bulk_with_worker_processes(monkeypatch, tmp_path: Path):
+    import markitdown.bulk_converter._bulk as bc
+    from markitdown import MarkItDown
+    from markitdown.bulk_converter import bulk_convert
+
+    # The real converter, built inside each worker process of the pool bulk_convert owns
+    monkeypatch.setattr(bc, "MarkItDown", MarkItDown)
+    src = tmp_path / "src"
+    (src / "sub").mkdir(parents=True)
+    for i in range(10):
+        (src / ("sub" if i % 2 else "") / f"n{i}.txt").write_text(f"# Note {i}\n\nsome plain text", encoding="utf-8")
+
+    dest = tmp_path / "out"
+    res = bulk_convert(src, dest=dest, workers=2)
+    assert (res.converted, res.failed, res.skipped) == (10, 0, 0)
+    assert res.total_headings == 10
+    assert res.total_words == 10 * 6
+    assert "# Note 3" in (dest / "sub" / "n3.md").read_text(encoding="utf-8")
+    assert "# Note 4" in (dest / "n4.md").read_text(encoding="utf-8")
+
+
 def test_conflict_rename(tmp_path: Path):
     from markitdown.bulk_converter import bulk_convert
 
@@ -80,6 +144,89 @@ def test_conflict_rename(tmp_path: Path):
     assert res.converted == 1
 
 
+def test_conflict_rename_within_one_run(tmp_path: Path):
+    from markitdown.bulk_converter import bulk_convert
+
+    src = tmp_path / "src"
+    src.mkdir()
+    # Both map to report.md; the second must not overwrite the first while it is being written
+    (src / "report.pdf").write_text("x", encoding="utf-8")
+    (src / "report.docx").write_text("y", encoding="utf-8")
+
+    dest = tmp_path / "out"
+    res = bulk_convert(src, dest=dest, on_conflict="rename")
+    outputs = sorted(p.name for p in dest.glob("report*.md"))
+    assert outputs == ["report (1).md", "report.md"]
+    assert res.converted == 2
+
+
+def test_conflict_rename_on_case_insensitive_destination(monkeypatch, tmp_path: Path):
+    import markitdown.bulk_converter._bulk as bc
+    from markitdown.bulk_converter import bulk_convert
+
+    # Stand in for a default macOS/Windows volume, where Report.md and report.md are one file
+    monkeypatch.setattr(bc, "_folds_case", lambda directory: True)
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "Report.pdf").write_text("x", encoding="utf-8")
+    (src / "report.docx").write_text("y", encoding="utf-8")
+
+    res = bulk_convert(src, dest=tmp_path / "out", on_conflict="rename")
+    assert sorted(f.dest.name.lower() for f in res.files) == ["report (1).md", "report.md"]
+    assert res.converted == 2
+
+
+@pytest.mark.parametrize("direct_write_max", [4096, 0], ids=["small-output", "large-output"])
+def test_name_taken_after_scan_is_not_overwritten(monkeypatch, tmp_path: Path, direct_write_max):
+    import markitdown.bulk_converter._bulk as bc
+    from markitdown.bulk_converter import bulk_convert
+
+    # 0 sends every output through the temp file + rename path
+    monkeypatch.setattr(bc, "_DIRECT_WRITE_MAX_BYTES", direct_write_max)
+    # Pretend the destination listing missed file.md, as if it appeared after the scan
+    monkeypatch.setattr(bc, "_existing_names", lambda parent, cache, key: cache.setdefault(parent, set()))
+    src = tmp_path / "src"
+    src.mkdir()
+    (src / "file.txt").write_text("x", encoding="utf-8")
+
+    dest = tmp_path / "out"
+    dest.mkdir()
+    (dest / "file.md").write_text("existing", encoding="utf-8")
+    res = bulk_convert(src, dest=dest, on_conflict="rename")
+    assert (dest / "file.md").read_text(encoding="utf-8") == "existing"
+    assert res.files[0].dest == dest / "file (1).md"
+    assert (dest / "file (1).md").exists()
+    assert not list(dest.glob("*.tmp"))
+    assert res.converted == 1
+
+    res = bulk_convert(src, dest=tmp_path / "out", on_conflict="skip")
+    assert [(f.status, f.reason) for f in res.files] == [("skipped", "exists")]
+    assert (res.converted, res.skipped) == (0, 1)
+
+
+def test_write_failure_stops_run_without_continue_on_error(monkeypatch, tmp_path: Path):
+    import markitdown.bulk_converter._bulk as bc
+    from markitdown.bulk_converter import bulk_convert
+
+    attempts = []
+
+    def _failing_write(dest_path, data, known_dirs=None, sync=False):
+        attempts.append(dest_path)
+        # Slow enough that the next files would be converted and queued meanwhile
+        time.sleep(0.05)
+        raise OSError("File name too long")
+
+    monkeypatch.setattr(bc, "_write_output", _failing_write)
+    src = tmp_path / "src"
+    src.mkdir()
+    for i in range(3):
+        (src / f"f{i}.txt").write_text("x", encoding="utf-8")
+
+    res = bulk_convert(src, dest=tmp_path / "out", continue_on_error=False)
+    assert len(attempts) == 1
+    assert (res.converted, res.failed) == (0, 1)
+
+
 def test_filters_and_skip_policy(tmp_path: Path):
     from markitdown.bulk_converter import bulk_convert
 
@@ -95,6 +242,12 @@ def test_filters_and_skip_policy(tmp_path: Path):
     assert not (dest / "b.md").exists()
     assert res.converted == 1
     assert res.skipped >= 1
+    # Filtered files are only counted unless individual records are requested
+    assert not [f for f in res.files if f.reason == "filtered"]
+
+    res = bulk_convert(src, dest=tmp_path / "out2", exclude_ext={".PDF"}, record_filtered=True)
+    assert [(f.src.name, f.reason) for f in res.files if f.status == "skipped"] == [("a.pdf", "filtered")]
+    assert res.converted == 1
 
 
 def test_threshold_confirmation(monkeypatch, tmp_path: Path):
@@ -127,3 +280,49 @@ def test_threshold_confirmation(monkeypatch, tmp_path: Path):
 
     res = bulk_convert(src, dest=dest, thresholds=th, confirm=_allow)
     assert res.converted == 3
+
+
+def test_preflight_counts_visible_tree(tmp_path: Path):
+    from markitdown.bulk_converter import bulk_convert, BulkConvertThresholds
+
+    src = tmp_path / "src"
+    src.mkdir()
+    _make_tree(src)
+
+    seen = []
+
+    def _capture(stats, th):
+        seen.append(stats)
+        return False
+
+    th = BulkConvertThresholds(max_dirs=0, max_files=0, max_bytes=0)
+    with pytest.raises(Exception):
+        bulk_convert(src, dest=tmp_path / "out", thresholds=th, confirm=_capture)
+
+    # root, a, b; .hidden is pruned along with its contents
+    stats = seen[0]
+    assert (stats.dirs, stats.files, stats.bytes) == (3, 3, len("hello") + len("%PDF") + len("docx"))
+
+
+def test_follow_symlinks_visits_each_directory_once(tmp_path: Path):
+    from markitdown.bulk_converter import bulk_convert
+
+    src = tmp_path / "src"
+    (src / "a").mkdir(parents=True)
+    (src / "a" / "f.txt").write_text("x", encoding="utf-8")
+    try:
+        # A cycle back to the root, and a second route into "a"
+        (src / "a" / "loop").symlink_to(src, target_is_directory=True)
+        (src / "alias").symlink_to(src / "a", target_is_directory=True)
+        (tmp_path / "outside").mkdir()
+        (tmp_path / "outside" / "g.txt").write_text("y", encoding="utf-8")
+        (src / "ext").symlink_to(tmp_path / "outside", target_is_directory=True)
+    except (OSError, NotImplementedError):
+        pytest.skip("symlinks not supported here")
+
+    res = bulk_convert(src, dest=tmp_path / "plain")
+    assert res.converted == 1
+
+    res = bulk_convert(src, dest=tmp_path / "followed", follow_symlinks=True)
+    assert res.converted == 2
+    assert (tmp_path / "followed" / "ext" / "g.md").exists()